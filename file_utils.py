@@ -12,7 +12,6 @@ Key Features:
 Dependencies:
     - csv: For reading CSV files
     - json: For JSON data serialization/deserialization
-    - re: For regular expression pattern matching
 
 Note:
     - All file operations use UTF-8 encoding
@@ -21,9 +20,9 @@ Note:
 """
 
 import csv
+import io
 import json
 import os
-import re
 from typing import Any, List
 
 
@@ -32,7 +31,7 @@ def read_csv_first_column(file_path: str) -> List[str]:
     Read and process stock symbols from the first column of a CSV file.
 
     This function:
-    1. Opens a CSV file with UTF-8 encoding
+    1. Reads the whole CSV file (UTF-8) in a single call
     2. Skips the header row
     3. Processes each symbol by:
        - Removing '-US' suffix
@@ -49,18 +48,20 @@ def read_csv_first_column(file_path: str) -> List[str]:
         FileNotFoundError: If the specified file does not exist
         csv.Error: If there's an error reading the CSV file
     """
-    symbols = []
+    # 파일 전체를 한 번에 읽은 뒤 메모리에서 파싱 (작은 read 호출 반복 방지)
     with open(file_path, newline="", encoding="utf-8") as csvfile:
-        reader = csv.reader(csvfile)
-        # Skip header row
-        next(reader, None)
-
-        for row in reader:
-            if row and len(row) > 0:  # Check if row exists and has at least one element
-                symbol = row[0].strip()  # Remove whitespace
-                if symbol:  # Check if symbol is not empty
-                    processed_symbol = re.sub("-US$", "", symbol).replace("/", "-")
-                    symbols.append(processed_symbol)
+        content = csvfile.read()
+
+    reader = csv.reader(io.StringIO(content, newline=""))
+    # Skip header row
+    next(reader, None)
+
+    symbols = []
+    for row in reader:
+        if row:  # Check if row exists and has at least one element
+            symbol = row[0].strip()  # Remove whitespace
+            if symbol:  # Check if symbol is not empty
+                symbols.append(symbol.removesuffix("-US").replace("/", "-"))
 
     return symbols
 
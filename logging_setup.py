@@ -10,6 +10,7 @@ Key Features:
     - JSON-based logging configuration
     - Queue handler support with automatic listener management
     - Proper cleanup of logging resources on program exit
+    - Idempotent setup: repeated calls do not reconfigure the logging system
 
 Dependencies:
     - atexit: For registering cleanup handlers
@@ -27,8 +28,14 @@ import json
 import logging.config
 import pathlib
 
+# dictConfig가 성공적으로 적용되었는지 여부 (재호출 시 전체 로거 계층 재구성을 방지)
+_CONFIGURED = False
 
-def setup_logging() -> None:
+# 설정 파일 파싱용 디코더 (모듈 로드 시 한 번만 생성)
+_decode_json = json.JSONDecoder().decode
+
+
+def setup_logging() -> logging.Logger:
     """
     Initialize and configure the application's logging system.
 
@@ -38,6 +45,13 @@ def setup_logging() -> None:
     3. Sets up queue handler listener if present
     4. Registers cleanup handler for program exit
 
+    Only the first successful call configures logging; later calls return the
+    already-configured root logger without re-reading the file or calling
+    dictConfig again (which would reset every logger in the hierarchy).
+
+    Returns:
+        logging.Logger: The configured root logger
+
     Note:
         - The configuration file should be located at logging_config/logging_config.json
         - If a queue handler is present, its listener is automatically started
@@ -47,9 +61,13 @@ def setup_logging() -> None:
         FileNotFoundError: If the logging configuration file is not found
         json.JSONDecodeError: If the configuration file contains invalid JSON
     """
+    global _CONFIGURED  # pylint: disable=global-statement
+    if _CONFIGURED:
+        return logging.getLogger()
+
     config_file = pathlib.Path("logging_config/logging_config.json")
     with open(config_file, encoding="utf-8") as f_in:
-        config = json.load(f_in)
+        config = _decode_json(f_in.read())
 
     # 로그 디렉토리 생성 (필요한 경우)
     # RotatingFileHandler는 파일은 생성하지만 디렉토리는 생성하지 않음
@@ -62,7 +80,11 @@ def setup_logging() -> None:
                 log_dir.mkdir(parents=True, exist_ok=True)
 
     logging.config.dictConfig(config)
-    queue_handler = logging.getLogger().handlers[0]  # Adjust as needed
+    _CONFIGURED = True
+
+    root_logger = logging.getLogger()
+    queue_handler = root_logger.handlers[0]  # Adjust as needed
     if hasattr(queue_handler, "listener"):
         queue_handler.listener.start()
         atexit.register(queue_handler.listener.stop)
+    return root_logger
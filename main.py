@@ -48,7 +48,7 @@ from logging_setup import setup_logging
 from sell_signals import SellDecision, SellReason, evaluate_sell_decisions, select_current_price
 from stock_analysis import UsaStockFinder
 from stock_operations import APIError, fetch_account_balance, fetch_holdings_detail, fetch_us_stock_holdings
-from stop_loss_cooldown import is_in_cooldown
+from stop_loss_cooldown import active_cooldown_set
 from telegram_utils import build_performance_summary_message, send_telegram_message
 from live_performance_logger import (
     append_account_snapshots,
@@ -431,17 +431,21 @@ def select_stocks(finder: UsaStockFinder, correlations: dict[str, dict[str, floa
     selected_buy, selected_not_sell = [], []
     valid_trend = finder.has_valid_trend_template(StrategyConfig.MARGIN)
     valid_trend_margin = finder.has_valid_trend_template(StrategyConfig.MARGIN_RELAXED)
+    # 루프 불변값은 한 번만 조회 (종목 순서를 유지해야 하므로 집합 연산 대신 순차 순회)
+    correlations_50 = correlations.get("50", {})
+    strict_threshold = StrategyConfig.CORRELATION_THRESHOLD_STRICT
+    relaxed_threshold = StrategyConfig.CORRELATION_THRESHOLD_RELAXED
 
     for symbol in finder.symbols:
-        correlation_50 = correlations.get("50", {}).get(symbol, 0.0)
-        if valid_trend[symbol] and correlation_50 >= StrategyConfig.CORRELATION_THRESHOLD_STRICT:
+        correlation_50 = correlations_50.get(symbol, 0.0)
+        if valid_trend[symbol] and correlation_50 >= strict_threshold:
             selected_buy.append(symbol)
             logger.info(
                 "Buy signal: %s (Trend: True, Correlation: %.2f%%)",
                 symbol,
                 correlation_50,
             )
-        elif valid_trend_margin[symbol] and correlation_50 >= StrategyConfig.CORRELATION_THRESHOLD_RELAXED:
+        elif valid_trend_margin[symbol] and correlation_50 >= relaxed_threshold:
             selected_not_sell.append(symbol)
             logger.info(
                 "Hold signal: %s (Trend(Margin): True, Correlation: %.2f%%)",
@@ -669,8 +673,10 @@ def generate_telegram_message(
     # Generate buy messages with investment details
     # new_buy_items (prev_items에 없는 것)만 표시하되, share_quantities가 있으면 상세 정보 표시
     # 매수 수량이 0인 종목은 share_quantities에 포함되지 않으므로 필터링
+    # prev_items는 리스트이므로 멤버십 검사를 위해 한 번만 frozenset으로 변환 (매수 순서는 유지)
+    prev_item_set = frozenset(prev_items)
     new_buy_items = [
-        item for item in buy_items if item not in prev_items and (not share_quantities or item in share_quantities)
+        item for item in buy_items if item not in prev_item_set and (not share_quantities or item in share_quantities)
     ]
 
     # buy_items 전체를 표시하되, 실제 변경사항(new_buy_items 또는 매도 신호)이 있을 때만 메시지 생성
@@ -855,27 +861,21 @@ def calculate_investment_per_stock(
         investment_per_stock = total_investment / num_stocks
         logger.info("Using equal distribution strategy")
 
-    # Apply min/max constraints and filter affordable stocks
-    affordable_stocks = []
-    for symbol in buy_items:
-        stock_investment = investment_per_stock
-
-        # Apply max constraint
-        if max_investment and stock_investment > max_investment:
-            stock_investment = max_investment
+    # Apply min/max constraints
+    # 모든 종목의 투자금이 동일하므로 제약 조건은 한 번만 계산 (통과 여부도 전체 종목 공통)
+    stock_investment = investment_per_stock
+    if max_investment and stock_investment > max_investment:
+        stock_investment = max_investment
 
-        # Check if meets minimum investment
-        if stock_investment >= min_investment:
-            affordable_stocks.append((symbol, stock_investment))
-        else:
+    # NaN 투자금도 제외되도록 ">= 최소 투자금"의 부정으로 판정
+    if not stock_investment >= min_investment:
+        for symbol in buy_items:
             logger.debug(
                 "Excluding stock %s: Investment amount %.2f < Minimum investment %.2f",
                 symbol,
                 stock_investment,
                 min_investment,
             )
-
-    if not affordable_stocks:
         logger.warning(
             "Available cash (%s) is insufficient for minimum investment (%s) for any stock",
             total_investment,
@@ -884,7 +884,7 @@ def calculate_investment_per_stock(
         return None
 
     # Create investment mapping
-    investment_map = {symbol: round(investment, 2) for symbol, investment in affordable_stocks}
+    investment_map = dict.fromkeys(buy_items, round(stock_investment, 2))
 
     logger.info(
         "Investment calculation: Total: %s, Reserve: %s, Per stock: %s, Stocks: %d (original: %d)",
@@ -1308,11 +1308,11 @@ def _prepare_finder_and_candidates(
 
 def _filter_buy_candidates_by_cooldown(buy_items: list[str]) -> list[str]:
     """Filter buy candidates that are in stop-loss cooldown period."""
-    today = date.today()
+    cooldown_symbols = active_cooldown_set(buy_items, date.today())
     original_buy_count = len(buy_items)
     filtered_buy_items = []
     for symbol in buy_items:
-        if is_in_cooldown(symbol, today):
+        if symbol in cooldown_symbols:
             logger.info("Symbol %s is in stop-loss cooldown. Skipping buy signal.", symbol)
         else:
             filtered_buy_items.append(symbol)
@@ -16,7 +16,7 @@ import logging
 from dataclasses import dataclass
 from datetime import date
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Collection, Dict, List
 
 from config import StrategyConfig
 from stock_analysis import UsaStockFinder
@@ -42,7 +42,7 @@ class SellReason(str, Enum):
     TREND = "TREND"  # Trend/strategy conditions no longer met
 
 
-@dataclass
+@dataclass(slots=True)
 class SellDecision:
     """
     Data class representing a sell decision for a stock.
@@ -60,8 +60,8 @@ class SellDecision:
 
 def evaluate_holding_trend_exit(
     symbol: str,
-    selected_buy: List[str],
-    selected_not_sell: List[str],
+    selected_buy: Collection[str],
+    selected_not_sell: Collection[str],
     holding_trend_exit_signals: Dict[str, bool] | None = None,
 ) -> tuple[bool, bool]:
     """Return explicit trend-exit 여부 and stale_holding 여부 for an existing holding."""
@@ -118,6 +118,10 @@ def evaluate_sell_decisions(
     trailing_state = load_trailing_state()
     trailing_state_modified = False
 
+    # 보유 종목마다 멤버십을 확인하므로 매수/보유 추천 목록은 한 번만 집합으로 변환
+    selected_buy_set = set(selected_buy)
+    selected_not_sell_set = set(selected_not_sell)
+
     for holding in holdings:
         symbol = holding.get("symbol", "")
         if not symbol:
@@ -150,9 +154,13 @@ def evaluate_sell_decisions(
             quantity,
         )
 
+        # 평단가 대비 손익률은 한 번만 계산해 모든 단계에서 재사용 (가격이 유효하지 않으면 None)
+        has_valid_prices = avg_price > 0 and current_price > 0
+        price_change_pct = (current_price - avg_price) / avg_price if has_valid_prices else None
+
         # Tier 1: Stop Loss (Absolute Priority)
-        if avg_price > 0 and current_price > 0:
-            loss_pct = (current_price - avg_price) / avg_price
+        if has_valid_prices:
+            loss_pct = price_change_pct
 
             logger.debug(
                 "%s: Stop Loss 체크 - loss_pct=%.4f (%.2f%%), STOP_LOSS_PCT=%.4f (%.2f%%)",
@@ -204,8 +212,8 @@ def evaluate_sell_decisions(
 
 
         # Tier 2: Special Situation Take Profit (price-pinned event gain realization)
-        if StrategyConfig.SPECIAL_SITUATION_TAKE_PROFIT_ENABLED and avg_price > 0 and current_price > 0:
-            profit_pct = (current_price - avg_price) / avg_price
+        if StrategyConfig.SPECIAL_SITUATION_TAKE_PROFIT_ENABLED and has_valid_prices:
+            profit_pct = price_change_pct
             min_profit_pct = StrategyConfig.SPECIAL_SITUATION_TAKE_PROFIT_MIN_PROFIT_PCT
             is_profit_eligible = profit_pct >= min_profit_pct
             is_pinned = finder.is_special_situation_price_pinned(symbol) if is_profit_eligible else False
@@ -238,8 +246,8 @@ def evaluate_sell_decisions(
                 continue
 
         # Tier 3: ATR 기반 TRAILING STOP (수익 보호용)
-        if StrategyConfig.TRAILING_ENABLED and avg_price > 0 and current_price > 0:
-            profit_pct = (current_price - avg_price) / avg_price
+        if StrategyConfig.TRAILING_ENABLED and has_valid_prices:
+            profit_pct = price_change_pct
             state_entry = trailing_state.get(symbol, {})
             trailing_activated = bool(state_entry.get("activated", False))
 
@@ -314,9 +322,8 @@ def evaluate_sell_decisions(
 
                     # 현재가가 트레일링 스탑 아래로 내려가면 매도
                     if current_price <= trailing_stop_price:
-                        # 쿨다운 이벤트 기록 (손익률 계산)
-                        trailing_loss_pct = (current_price - avg_price) / avg_price if avg_price > 0 else None
-                        record_stop_loss_event(symbol, trailing_loss_pct, date.today())
+                        # 쿨다운 이벤트 기록 (공통 손익률 사용)
+                        record_stop_loss_event(symbol, price_change_pct, date.today())
 
                         logger.info(
                             "%s: 🟨 TRAILING 매도 결정 - current_price=%.4f <= trailing_stop_price=%.4f, "
@@ -356,9 +363,8 @@ def evaluate_sell_decisions(
         logger.debug("%s: AVSL 체크 - avsl_signal=%s", symbol, avsl_signal)
 
         if avsl_signal:
-            # 쿨다운 이벤트 기록 (손익률 계산)
-            avsl_loss_pct = (current_price - avg_price) / avg_price if avg_price > 0 and current_price > 0 else None
-            record_stop_loss_event(symbol, avsl_loss_pct, date.today())
+            # 쿨다운 이벤트 기록 (공통 손익률 사용)
+            record_stop_loss_event(symbol, price_change_pct, date.today())
 
             logger.info(
                 "%s: 🟧 AVSL 매도 결정 - 거래량 지지선 붕괴, quantity=%.2f",
@@ -371,8 +377,8 @@ def evaluate_sell_decisions(
         # Tier 5: Trend/Strategy Condition Failure (explicit holding trend-exit only)
         should_exit_trend, stale_holding = evaluate_holding_trend_exit(
             symbol=symbol,
-            selected_buy=selected_buy,
-            selected_not_sell=selected_not_sell,
+            selected_buy=selected_buy_set,
+            selected_not_sell=selected_not_sell_set,
             holding_trend_exit_signals=holding_trend_exit_signals,
         )
 
@@ -384,9 +390,8 @@ def evaluate_sell_decisions(
         )
 
         if should_exit_trend:
-            # 쿨다운 이벤트 기록 (손익률 계산)
-            trend_loss_pct = (current_price - avg_price) / avg_price if avg_price > 0 and current_price > 0 else None
-            record_stop_loss_event(symbol, trend_loss_pct, date.today())
+            # 쿨다운 이벤트 기록 (공통 손익률 사용)
+            record_stop_loss_event(symbol, price_change_pct, date.today())
 
             logger.info(
                 "%s: 🟦 TREND 매도 결정 - explicit holding trend-exit signal, quantity=%.2f",
@@ -59,14 +59,20 @@ class UsaStockFinder:
         self.last_high = {}
         self.last_low = {}
         self.current_price = {}
+        # 필드별 집계 결과 (첫 유효 종목에서 한 번만 전체 컬럼에 대해 계산)
+        high_max = last_close = low_min = None
         for symbol in self.symbols:
             try:
                 # Separate data validation into helper function
                 if self._is_symbol_data_valid(symbol):
-
-                    self.last_high[symbol] = self.stock_data["High"][symbol].max()
-                    self.current_price[symbol] = self.stock_data["Close"][symbol].iloc[-1]
-                    self.last_low[symbol] = self.stock_data["Low"][symbol].min()
+                    if high_max is None:
+                        high_max = self.stock_data["High"].max()
+                        last_close = self.stock_data["Close"].iloc[-1]
+                        low_min = self.stock_data["Low"].min()
+
+                    self.last_high[symbol] = high_max[symbol]
+                    self.current_price[symbol] = last_close[symbol]
+                    self.last_low[symbol] = low_min[symbol]
                 else:
                     # Set default values when data is not available
                     self.last_high[symbol] = 0.0
@@ -468,6 +474,26 @@ class UsaStockFinder:
 
         return result
 
+    def _close_window_mean(self, days: int, offset: int = 0) -> pd.Series:
+        """
+        Calculate the mean of every Close column over a single ``days``-long window.
+
+        Equivalent to ``rolling(window=days).mean().iloc[-1 - offset]`` (NaN if the window is
+        incomplete or contains NaN), without materializing the whole rolling series.
+
+        Args:
+            days (int): Window size
+            offset (int): Number of rows the window ends before the latest row
+
+        Returns:
+            pd.Series: Window mean of Close prices, indexed by symbol
+        """
+        close = self.stock_data["Close"]
+        end = len(close) - offset
+        if end < days:
+            return pd.Series(np.nan, index=close.columns)
+        return close.iloc[end - days : end].mean(skipna=False)
+
     def get_moving_averages(self, days: int) -> Dict[str, float]:
         """
         Calculate moving average prices for the specified period.
@@ -480,14 +506,14 @@ class UsaStockFinder:
                 Returns 0.0 for symbols with insufficient data (will be excluded later).
         """
         result = {}
+        latest_ma = None  # 전체 종가 컬럼의 최근 이동평균 (첫 유효 종목에서 한 번만 계산)
+        close = self.stock_data.get("Close", pd.DataFrame())
         for symbol in self.symbols:
             try:
-                if (
-                    symbol in self.stock_data["Close"]
-                    and not self.stock_data["Close"][symbol].empty
-                    and len(self.stock_data["Close"][symbol]) >= days
-                ):
-                    ma_value = self.stock_data["Close"][symbol].rolling(window=days).mean().iloc[-1]
+                if symbol in close and not close[symbol].empty and len(close[symbol]) >= days:
+                    if latest_ma is None:
+                        latest_ma = self._close_window_mean(days)
+                    ma_value = latest_ma[symbol]
                     result[symbol] = float(ma_value)
                     logger.debug("%s: MA%d = %.2f", symbol, days, ma_value)
                 else:
@@ -496,7 +522,7 @@ class UsaStockFinder:
                         "%s: Insufficient data (Required: %d days, Actual: %d days), Cannot calculate MA%d",
                         symbol,
                         days,
-                        len(self.stock_data["Close"][symbol]) if symbol in self.stock_data["Close"] else 0,
+                        len(close[symbol]) if symbol in close else 0,
                         days,
                     )
             except (IndexError, KeyError, AttributeError) as e:
@@ -517,18 +543,20 @@ class UsaStockFinder:
         result = {}
         check_days = StrategyConfig.MA_INCREASE_CHECK_DAYS
         required_days = StrategyConfig.MA_200_DAYS
+        # 전체 종가 컬럼의 현재 MA200과 check_days 전 MA200 (첫 유효 종목에서 한 번만 계산)
+        current_ma_all = past_ma_all = None
+        close = self.stock_data.get("Close", pd.DataFrame())
 
         for symbol in self.symbols:
             try:
-                if (
-                    symbol in self.stock_data["Close"]
-                    and not self.stock_data["Close"][symbol].empty
-                    and len(self.stock_data["Close"][symbol]) >= required_days
-                ):
-                    ma_200 = self.stock_data["Close"][symbol].rolling(window=required_days).mean()
-                    if len(ma_200) >= check_days:
-                        current_ma = ma_200.iloc[-1]
-                        past_ma = ma_200.iloc[-check_days]
+                if symbol in close and not close[symbol].empty and len(close[symbol]) >= required_days:
+                    close_len = len(close[symbol])
+                    if close_len >= check_days:
+                        if current_ma_all is None:
+                            current_ma_all = self._close_window_mean(required_days)
+                            past_ma_all = self._close_window_mean(required_days, offset=check_days - 1)
+                        current_ma = current_ma_all[symbol]
+                        past_ma = past_ma_all[symbol]
                         result[symbol] = current_ma >= past_ma * (1 - margin)
                         logger.debug(
                             "%s: MA200 increase check (Current: %.2f, %d days ago: %.2f, Margin: %.2f%%) -> %s",
@@ -545,7 +573,7 @@ class UsaStockFinder:
                             "%s: MA200 insufficient data (Required: %d days, Actual: %d days)",
                             symbol,
                             check_days,
-                            len(ma_200),
+                            close_len,
                         )
                 else:
                     result[symbol] = False
@@ -553,7 +581,7 @@ class UsaStockFinder:
                         "%s: Cannot calculate MA200 (Required: %d days, Actual: %d days)",
                         symbol,
                         required_days,
-                        len(self.stock_data["Close"][symbol]) if symbol in self.stock_data["Close"] else 0,
+                        len(close[symbol]) if symbol in close else 0,
                     )
             except (IndexError, KeyError, AttributeError) as e:
                 result[symbol] = False
@@ -593,26 +621,22 @@ class UsaStockFinder:
         is_increasing_with_volume_and_price = self.compare_volume_price_movement(StrategyConfig.MA_200_DAYS, margin)
 
         diagnostics: Dict[str, Dict[str, Any]] = {}
+        tolerance = 1 - margin
         for symbol in self.symbols:
-            has_sufficient_ma_data = not (
-                latest_50_ma[symbol] == 0.0 or latest_150_ma[symbol] == 0.0 or latest_200_ma[symbol] == 0.0
-            )
+            price = current_price[symbol]
+            ma_50 = latest_50_ma[symbol]
+            ma_150 = latest_150_ma[symbol]
+            ma_200 = latest_200_ma[symbol]
+            has_sufficient_ma_data = not (ma_50 == 0.0 or ma_150 == 0.0 or ma_200 == 0.0)
 
             conditions = {
-                "price_above_ma150": has_sufficient_ma_data
-                and current_price[symbol] >= latest_150_ma[symbol] * (1 - margin),
-                "price_above_ma200": has_sufficient_ma_data
-                and current_price[symbol] >= latest_200_ma[symbol] * (1 - margin),
-                "ma150_above_ma200": has_sufficient_ma_data
-                and latest_150_ma[symbol] >= latest_200_ma[symbol] * (1 - margin),
+                "price_above_ma150": has_sufficient_ma_data and price >= ma_150 * tolerance,
+                "price_above_ma200": has_sufficient_ma_data and price >= ma_200 * tolerance,
+                "ma150_above_ma200": has_sufficient_ma_data and ma_150 >= ma_200 * tolerance,
                 "ma200_increasing": has_sufficient_ma_data and is_ma_increasing[symbol],
-                "ma50_above_ma150": has_sufficient_ma_data
-                and latest_50_ma[symbol] >= latest_150_ma[symbol] * (1 - margin),
-                "ma50_above_ma200": has_sufficient_ma_data
-                and latest_50_ma[symbol] >= latest_200_ma[symbol] * (1 - margin),
-                "price_above_ma50": (
-                    has_sufficient_ma_data and current_price[symbol] >= latest_50_ma[symbol] * (1 - margin)
-                ),
+                "ma50_above_ma150": has_sufficient_ma_data and ma_50 >= ma_150 * tolerance,
+                "ma50_above_ma200": has_sufficient_ma_data and ma_50 >= ma_200 * tolerance,
+                "price_above_ma50": has_sufficient_ma_data and price >= ma_50 * tolerance,
                 "above_52_week_low_threshold": is_above_low[symbol],
                 "above_52_week_high_threshold": is_above_75_percent_of_high[symbol],
                 "positive_volume_price_correlation": is_increasing_with_volume_and_price[symbol],
@@ -625,9 +649,9 @@ class UsaStockFinder:
                     "%s: Cannot evaluate trend template due to insufficient data "
                     "(MA50: %.2f, MA150: %.2f, MA200: %.2f)",
                     symbol,
-                    latest_50_ma[symbol],
-                    latest_150_ma[symbol],
-                    latest_200_ma[symbol],
+                    ma_50,
+                    ma_150,
+                    ma_200,
                 )
 
             final_result = has_sufficient_ma_data and all(conditions.values())
@@ -640,21 +664,20 @@ class UsaStockFinder:
 
         return diagnostics
 
-    def _calculate_price_volume_correlation(self, period_data, symbol: str) -> float:
+    def _calculate_price_volume_correlation(self, period_data: pd.DataFrame) -> pd.Series:
         """
-        Calculate the correlation between price and volume changes.
+        Calculate the correlation between price and volume changes for every symbol at once.
 
         Args:
             period_data (pd.DataFrame): DataFrame containing price and volume data
-            symbol (str): Stock symbol to analyze
 
         Returns:
-            float: Percentage of positive price-volume correlation
+            pd.Series: Percentage of positive price-volume correlation, indexed by symbol
         """
-        price_diff = period_data["Close"][symbol].diff()
-        volume_diff = period_data["Volume"][symbol].diff()
-        positive_correlation = float(((price_diff >= 0) & (volume_diff >= 0)).mean() * 100)
-        negative_correlation = float(((price_diff < 0) & (volume_diff < 0)).mean() * 100)
+        price_diff = period_data["Close"].diff()
+        volume_diff = period_data["Volume"].diff()
+        positive_correlation = ((price_diff >= 0) & (volume_diff >= 0)).mean() * 100
+        negative_correlation = ((price_diff < 0) & (volume_diff < 0)).mean() * 100
         return positive_correlation + negative_correlation
 
     def price_volume_correlation_percent(self, recent_days: int) -> Dict[str, float]:
@@ -667,27 +690,26 @@ class UsaStockFinder:
         Returns:
             Dict[str, float]: Dictionary of correlation percentages for each symbol
         """
-        period_data = self.stock_data.tail(recent_days)
-        return {symbol: self._calculate_price_volume_correlation(period_data, symbol) for symbol in self.symbols}
+        correlation = self._calculate_price_volume_correlation(self.stock_data.tail(recent_days))
+        return {symbol: float(correlation[symbol]) for symbol in self.symbols}
 
-    def _compare_volume_price(self, period_data, symbol: str, margin: float) -> bool:
+    def _compare_volume_price(self, period_data: pd.DataFrame, margin: float) -> pd.Series:
         """
-        Compare volume and price movements to identify potential bullish signals.
+        Compare volume and price movements to identify potential bullish signals for every symbol at once.
 
         Args:
             period_data (pd.DataFrame): Historical price and volume data
-            symbol (str): Stock symbol to analyze
             margin (float): Tolerance factor for comparison
 
         Returns:
-            bool: True if bullish signal is detected based on volume and price comparison
-        """
-        average_volume = period_data["Volume"][symbol].mean()
-        volume_data = period_data["Volume"][symbol]
-        price_diff_data = period_data["Close"][symbol].diff()
-        volume_up_days = volume_data > average_volume
-        price_up_days = int((price_diff_data[volume_up_days] >= 0).sum())
-        price_down_days = int((price_diff_data[volume_up_days] < 0).sum())
+            pd.Series: True if bullish signal is detected based on volume and price comparison, indexed by symbol
+        """
+        volume_data = period_data["Volume"]
+        volume_up_days = volume_data > volume_data.mean()
+        # 평균 이상 거래량일의 가격 변화만 남기고 나머지는 NaN (비교 시 False로 집계)
+        price_diff_data = period_data["Close"].diff().where(volume_up_days)
+        price_up_days = (price_diff_data >= 0).sum()
+        price_down_days = (price_diff_data < 0).sum()
         return price_up_days >= price_down_days * (1 - margin)
 
     def compare_volume_price_movement(self, recent_days: int, margin: float) -> Dict[str, bool]:
@@ -701,8 +723,8 @@ class UsaStockFinder:
         Returns:
             Dict[str, bool]: True if price increases occur with above-average volume
         """
-        period_data = self.stock_data.tail(recent_days)
-        return {symbol: self._compare_volume_price(period_data, symbol, margin) for symbol in self.symbols}
+        bullish = self._compare_volume_price(self.stock_data.tail(recent_days), margin)
+        return {symbol: bool(bullish[symbol]) for symbol in self.symbols}
 
     def calculate_original_avsl_report(self, symbol: str) -> pd.DataFrame | None:
         """Return original Buff Dormeier AVSL diagnostics for live sell decisions.
@@ -762,6 +784,7 @@ class UsaStockFinder:
         """
         result: Dict[str, bool] = {}
         logger.info("AVSL signal evaluation uses original AVSL")
+        close = self.stock_data.get("Close", pd.DataFrame())
 
         for symbol in self.symbols:
             try:
@@ -771,12 +794,12 @@ class UsaStockFinder:
                     logger.debug("%s: AVSL calculation failed or insufficient data", symbol)
                     continue
 
-                if symbol not in self.stock_data["Close"] or self.stock_data["Close"][symbol].empty:
+                if symbol not in close or close[symbol].empty:
                     result[symbol] = False
                     logger.debug("%s: AVSL signal skipped because close data is unavailable", symbol)
                     continue
 
-                current_close = float(self.stock_data["Close"][symbol].iloc[-1])
+                current_close = float(close[symbol].iloc[-1])
                 if not np.isfinite(current_close):
                     result[symbol] = False
                     logger.debug("%s: AVSL signal skipped because latest close is non-finite", symbol)
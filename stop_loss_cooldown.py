@@ -21,7 +21,7 @@ import json
 import logging
 import os
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 from config import StrategyConfig
 
@@ -196,8 +196,30 @@ def is_in_cooldown(symbol: str, today: date) -> bool:
         bool: 쿨다운 기간 내이면 True, 아니면 False
     """
     log = load_stop_loss_log()
-    entry = log.get(symbol)
+    return _is_entry_in_cooldown(symbol, log.get(symbol), today)
 
+
+def active_cooldown_set(symbols: Iterable[str], today: date) -> set[str]:
+    """
+    로그를 한 번만 읽어 주어진 심볼 중 쿨다운 기간 내에 있는 심볼 집합을 반환한다.
+
+    여러 후보 종목을 필터링할 때 is_in_cooldown을 종목마다 호출하면 매번 로그 파일을
+    다시 읽으므로, 이 함수로 집합을 만든 뒤 멤버십 검사로 대체한다.
+    로그의 다른 종목은 검사하지 않는다.
+
+    Args:
+        symbols (Iterable[str]): 검사할 종목 심볼들
+        today (date): 오늘 날짜
+
+    Returns:
+        set[str]: symbols 중 쿨다운 기간 내에 있는 심볼 집합
+    """
+    log = load_stop_loss_log()
+    return {symbol for symbol in symbols if _is_entry_in_cooldown(symbol, log.get(symbol), today)}
+
+
+def _is_entry_in_cooldown(symbol: str, entry: Dict[str, Any] | None, today: date) -> bool:
+    """단일 로그 항목에 대해 쿨다운 기간 내인지 판정한다 (파싱 실패 시 False)."""
     if not entry:
         logger.debug("%s: Stop Loss 로그에 없음, 쿨다운 아님", symbol)
         return False
@@ -229,6 +251,6 @@ def is_in_cooldown(symbol: str, today: date) -> bool:
 
         return is_cooldown
 
-    except (KeyError, ValueError) as e:
+    except (KeyError, TypeError, ValueError) as e:
         logger.warning("%s: Stop Loss 로그 항목 파싱 실패: %s, 쿨다운 아님으로 처리", symbol, str(e))
         return False
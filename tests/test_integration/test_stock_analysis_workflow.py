@@ -19,6 +19,20 @@ from stock_operations import fetch_us_stock_holdings
 class TestStockAnalysisWorkflow(unittest.TestCase):
     """Test complete stock analysis workflow integration"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Patch broker environment variables once for the whole class"""
+        cls._env_patcher = patch.dict(
+            "os.environ",
+            {"ki_app_key": "test_key", "ki_app_secret_key": "test_secret", "account_number": "test_account"},
+        )
+        cls._env_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore environment variables"""
+        cls._env_patcher.stop()
+
     def setUp(self):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
@@ -136,13 +150,8 @@ class TestStockAnalysisWorkflow(unittest.TestCase):
         }
         mock_korea_investment.return_value = mock_api
 
-        # Mock environment variables
-        with patch.dict(
-            "os.environ",
-            {"ki_app_key": "test_key", "ki_app_secret_key": "test_secret", "account_number": "test_account"},
-        ):
-            # Test fetch_us_stock_holdings
-            holdings = fetch_us_stock_holdings()
+        # Test fetch_us_stock_holdings (environment variables patched in setUpClass)
+        holdings = fetch_us_stock_holdings()
 
         # Verify holdings structure
         self.assertIn("AAPL-US", holdings)
@@ -273,27 +282,27 @@ class TestStockAnalysisWorkflow(unittest.TestCase):
         import time
 
         # Test portfolio reading performance
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         from file_utils import read_csv_first_column
 
         symbols = read_csv_first_column(self.portfolio_file)
-        read_time = time.time() - start_time
+        read_time_ns = time.perf_counter_ns() - start_ns
 
         # Verify reasonable performance (should be under 1 second)
-        self.assertLess(read_time, 1.0)
+        self.assertLess(read_time_ns, 1_000_000_000)
         self.assertEqual(len(symbols), 3)
 
         # Test JSON operations performance
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         from file_utils import load_json, save_json
 
         data = load_json(self.data_file)
         data["test_performance"] = True
         save_json(data, self.data_file)
-        json_time = time.time() - start_time
+        json_time_ns = time.perf_counter_ns() - start_ns
 
         # Verify reasonable performance
-        self.assertLess(json_time, 1.0)
+        self.assertLess(json_time_ns, 1_000_000_000)
 
     def test_memory_integration(self):
         """Test memory usage of integrated workflow"""
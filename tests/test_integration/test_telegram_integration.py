@@ -6,6 +6,7 @@ Tests the interaction between Telegram messaging, stock analysis, and main workf
 """
 
 import asyncio
+import collections
 import json
 import os
 import tempfile
@@ -15,6 +16,35 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from main import generate_telegram_message, select_stocks
 from telegram_utils import send_telegram_message
 
+PortfolioScenario = collections.namedtuple(
+    "PortfolioScenario", "name prev_items buy_items not_sell_items expected_messages"
+)
+
+# 포트폴리오 변경 시나리오 (불변이므로 모듈 로드 시 한 번만 생성)
+_PORTFOLIO_SCENARIOS = (
+    PortfolioScenario(
+        "new_buy_recommendations",
+        ("AAPL", "MSFT"),
+        ("AAPL", "MSFT", "GOOGL", "NVDA"),
+        ("AAPL", "MSFT", "GOOGL"),
+        ("Buy GOOGL", "Buy NVDA"),
+    ),
+    PortfolioScenario(
+        "sell_recommendations",
+        ("AAPL", "MSFT", "GOOGL", "TSLA"),
+        ("AAPL", "MSFT"),
+        ("AAPL", "MSFT", "GOOGL"),
+        ("Sell TSLA",),
+    ),
+    PortfolioScenario(
+        "mixed_changes",
+        ("AAPL", "MSFT", "GOOGL"),
+        ("AAPL", "MSFT", "NVDA"),
+        ("AAPL", "MSFT", "GOOGL"),
+        ("Buy NVDA",),
+    ),
+)
+
 
 class TestTelegramIntegration(unittest.TestCase):
     """Test Telegram integration with stock selection workflow"""
@@ -106,41 +136,17 @@ class TestTelegramIntegration(unittest.TestCase):
         mock_bot_class.return_value = mock_bot
 
         # Test various portfolio change scenarios
-        test_scenarios = [
-            {
-                "name": "new_buy_recommendations",
-                "prev_items": ["AAPL", "MSFT"],
-                "buy_items": ["AAPL", "MSFT", "GOOGL", "NVDA"],
-                "not_sell_items": ["AAPL", "MSFT", "GOOGL"],
-                "expected_messages": ["Buy GOOGL", "Buy NVDA"],
-            },
-            {
-                "name": "sell_recommendations",
-                "prev_items": ["AAPL", "MSFT", "GOOGL", "TSLA"],
-                "buy_items": ["AAPL", "MSFT"],
-                "not_sell_items": ["AAPL", "MSFT", "GOOGL"],
-                "expected_messages": ["Sell TSLA"],
-            },
-            {
-                "name": "mixed_changes",
-                "prev_items": ["AAPL", "MSFT", "GOOGL"],
-                "buy_items": ["AAPL", "MSFT", "NVDA"],
-                "not_sell_items": ["AAPL", "MSFT", "GOOGL"],
-                "expected_messages": ["Buy NVDA"],
-            },
-        ]
-
-        for scenario in test_scenarios:
-            with self.subTest(scenario=scenario["name"]):
+        for scenario in _PORTFOLIO_SCENARIOS:
+            with self.subTest(scenario=scenario.name):
                 # Generate message for scenario
                 message = generate_telegram_message(
-                    scenario["prev_items"], scenario["buy_items"], scenario["not_sell_items"]
+                    list(scenario.prev_items), list(scenario.buy_items), list(scenario.not_sell_items)
                 )
 
                 # Verify message contains expected content
                 if message:  # Some scenarios might return None (no changes)
                     message_text = "\n".join(message) if isinstance(message, list) else str(message)
-                    for expected_msg in scenario["expected_messages"]:
+                    for expected_msg in scenario.expected_messages:
                         # Extract symbol from "Buy SYMBOL" or "Sell SYMBOL"
                         symbol = expected_msg.split()[-1]
                         # Check if symbol is in message (new format uses Korean emojis)
@@ -308,7 +314,7 @@ class TestTelegramIntegration(unittest.TestCase):
         mock_bot_class.return_value = mock_bot
 
         # Test message generation performance
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Generate multiple messages
         messages = []
@@ -321,15 +327,15 @@ class TestTelegramIntegration(unittest.TestCase):
             if message:
                 messages.append(message)
 
-        generation_time = time.time() - start_time
+        generation_time_ns = time.perf_counter_ns() - start_ns
 
         # Verify reasonable performance
-        self.assertLess(generation_time, 1.0)  # Should complete within 1 second
+        self.assertLess(generation_time_ns, 1_000_000_000)  # Should complete within 1 second
         self.assertGreater(len(messages), 0)
 
         # Test message sending performance
         async def test_send_performance():
-            start_time = time.time()
+            send_start_ns = time.perf_counter_ns()
 
             # Send messages concurrently
             tasks = [
@@ -339,10 +345,10 @@ class TestTelegramIntegration(unittest.TestCase):
 
             await asyncio.gather(*tasks)
 
-            send_time = time.time() - start_time
+            send_time_ns = time.perf_counter_ns() - send_start_ns
 
             # Verify reasonable performance
-            self.assertLess(send_time, 2.0)  # Should complete within 2 seconds
+            self.assertLess(send_time_ns, 2_000_000_000)  # Should complete within 2 seconds
             self.assertEqual(mock_bot.sendMessage.call_count, 10)
 
         asyncio.run(test_send_performance())
@@ -7,99 +7,139 @@ It tests logging configuration setup and error handling scenarios.
 
 import json
 import logging
-import os
-import tempfile
+import logging.config
 import unittest
-from unittest.mock import MagicMock, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, mock_open, patch
 
 from logging_setup import setup_logging
 
+# 테스트용 로깅 설정 (모듈 로드 시 한 번만 생성, dictConfig는 입력 dict를 변경하지 않음)
+_BASE_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"}},
+    "handlers": {
+        "default": {
+            "level": "INFO",
+            "formatter": "standard",
+            "class": "logging.StreamHandler",
+            "stream": "ext://sys.stdout",
+        }
+    },
+    "loggers": {"": {"handlers": ["default"], "level": "INFO", "propagate": False}},
+}
+
+_QUEUE_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {"standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"}},
+    "handlers": {
+        "queue_handler": {
+            "level": "INFO",
+            "formatter": "standard",
+            "class": "logging.handlers.QueueHandler",
+            "queue": "ext://queue.Queue",
+        }
+    },
+    "loggers": {"": {"handlers": ["queue_handler"], "level": "INFO", "propagate": False}},
+}
+
+_MINIMAL_CONFIG = {
+    "version": 1,
+    "handlers": {"console": {"class": "logging.StreamHandler", "level": "DEBUG"}},
+    "root": {"level": "INFO", "handlers": ["console"]},
+}
+
+_FILE_CONFIG = {
+    "version": 1,
+    "handlers": {"file": {"class": "logging.FileHandler", "filename": "test.log", "level": "INFO"}},
+    "root": {"level": "INFO", "handlers": ["file"]},
+}
+
+# (name, config, expected root handler count) - queue listener 없는 설정
+_VARIANT_CASES = (
+    ("success", _BASE_CONFIG, 1),
+    ("minimal_config", _MINIMAL_CONFIG, 1),
+)
+
+# (name, config, has_listener) - 큐 핸들러 리스너 시작/정리 등록 여부
+_LISTENER_CASES = (
+    ("queue_handler", _QUEUE_CONFIG, True),
+    ("no_queue_handler", _FILE_CONFIG, False),
+)
+
 
 class TestLoggingSetup(unittest.TestCase):
     """Test logging_setup module functions"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Snapshot the root handlers installed before these tests run"""
+        cls._saved_handlers = logging.getLogger().handlers[:]
+
     def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.logging_config_dir = os.path.join(self.temp_dir, "logging_config")
-        os.makedirs(self.logging_config_dir)
-        self.config_file_path = os.path.join(self.logging_config_dir, "logging_config.json")
+        """Start each test from an unconfigured logging_setup module"""
+        configured_patcher = patch("logging_setup._CONFIGURED", False)
+        configured_patcher.start()
+        self.addCleanup(configured_patcher.stop)
 
     def tearDown(self):
         """Clean up test fixtures"""
-        # Reset logging configuration
-        logging.getLogger().handlers.clear()
-
-        # Remove test files
-        if os.path.exists(self.config_file_path):
-            os.remove(self.config_file_path)
-        if os.path.exists(self.logging_config_dir):
-            os.rmdir(self.logging_config_dir)
-        if os.path.exists(self.temp_dir):
-            os.rmdir(self.temp_dir)
-
-    def test_setup_logging_success(self):
-        """Test successful logging setup"""
-        # Create test logging configuration
-        test_config = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {"standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"}},
-            "handlers": {
-                "default": {
-                    "level": "INFO",
-                    "formatter": "standard",
-                    "class": "logging.StreamHandler",
-                    "stream": "ext://sys.stdout",
-                }
-            },
-            "loggers": {"": {"handlers": ["default"], "level": "INFO", "propagate": False}},
-        }
-
-        # Mock the open function to return our test config
-        mock_file = mock_open(read_data=json.dumps(test_config))
-        with patch("builtins.open", mock_file):
-            # Call setup_logging
-            setup_logging()
-
-            # Verify logging is configured
-            root_logger = logging.getLogger()
-            self.assertTrue(len(root_logger.handlers) > 0)
-
-    def test_setup_logging_with_queue_handler(self):
-        """Test logging setup with queue handler"""
-        # Create test logging configuration with queue handler
-        test_config = {
-            "version": 1,
-            "disable_existing_loggers": False,
-            "formatters": {"standard": {"format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s"}},
-            "handlers": {
-                "queue_handler": {
-                    "level": "INFO",
-                    "formatter": "standard",
-                    "class": "logging.handlers.QueueHandler",
-                    "queue": "ext://queue.Queue",
-                }
-            },
-            "loggers": {"": {"handlers": ["queue_handler"], "level": "INFO", "propagate": False}},
-        }
-
-        # Mock the open function to return our test config
-        mock_file = mock_open(read_data=json.dumps(test_config))
-        with patch("builtins.open", mock_file):
-            # Mock the queue handler to have a listener attribute
-            with patch("logging_setup.logging.getLogger") as mock_get_logger:
-                mock_logger = MagicMock()
-                mock_handler = MagicMock()
-                mock_handler.listener = MagicMock()
-                mock_logger.handlers = [mock_handler]
-                mock_get_logger.return_value = mock_logger
-
-                # Call setup_logging
-                setup_logging()
-
-                # Verify listener was started and cleanup was registered
-                mock_handler.listener.start.assert_called_once()
+        # Restore the root handlers captured before the tests ran
+        logging.getLogger().handlers[:] = self._saved_handlers
+
+    def test_setup_logging_variants(self):
+        """Test logging setup across configurations without a queue listener"""
+        with patch("builtins.open", mock_open(read_data="")), patch("logging_setup.atexit.register") as mock_register:
+            for name, config, expected_handlers in _VARIANT_CASES:
+                with self.subTest(name=name):
+                    # dictConfig replaces the root handlers, so no manual clearing is needed
+                    with patch("logging_setup._CONFIGURED", False), patch(
+                        "logging_setup._decode_json", return_value=config
+                    ):
+                        setup_logging()
+
+                    # Verify logging is configured
+                    self.assertEqual(len(logging.getLogger().handlers), expected_handlers)
+                    # No queue listener, so no cleanup is registered
+                    mock_register.assert_not_called()
+
+    def test_setup_logging_listener_variants(self):
+        """Test listener start/cleanup registration with and without a queue handler"""
+        with patch("builtins.open", mock_open(read_data="")), patch("logging_setup.atexit.register") as mock_register:
+            for name, config, has_listener in _LISTENER_CASES:
+                with self.subTest(name=name):
+                    mock_register.reset_mock()
+                    # Queue handlers expose a listener attribute; plain handlers do not
+                    mock_handler = SimpleNamespace(listener=Mock()) if has_listener else Mock(spec=logging.Handler)
+                    mock_logger = Mock(spec=logging.Logger)
+                    mock_logger.handlers = [mock_handler]
+
+                    with patch("logging_setup._CONFIGURED", False), patch(
+                        "logging_setup._decode_json", return_value=config
+                    ), patch("logging_setup.logging.getLogger", return_value=mock_logger):
+                        setup_logging()
+
+                    if has_listener:
+                        # Verify listener was started and cleanup was registered
+                        mock_handler.listener.start.assert_called_once()
+                        mock_register.assert_called_once_with(mock_handler.listener.stop)
+                    else:
+                        mock_register.assert_not_called()
+
+    def test_setup_logging_is_idempotent(self):
+        """Test repeated setup calls configure logging only once"""
+        with patch("builtins.open", mock_open(read_data="")), patch(
+            "logging_setup._decode_json", return_value=_BASE_CONFIG
+        ) as mock_load, patch("logging_setup.logging.config.dictConfig", wraps=logging.config.dictConfig) as mock_dict:
+            first = setup_logging()
+            second = setup_logging()
+
+        self.assertIs(first, logging.getLogger())
+        self.assertIs(second, first)
+        mock_load.assert_called_once()
+        mock_dict.assert_called_once()
 
     def test_setup_logging_file_not_found(self):
         """Test logging setup with non-existent config file"""
@@ -111,90 +151,20 @@ class TestLoggingSetup(unittest.TestCase):
 
     def test_setup_logging_invalid_json(self):
         """Test logging setup with invalid JSON config"""
-        # Mock the open function to return invalid JSON
-        mock_file = mock_open(read_data="{invalid json content")
-        with patch("builtins.open", mock_file):
+        # Feed invalid content through the real module-level decoder
+        with patch("builtins.open", mock_open(read_data="{invalid")):
             # Should raise json.JSONDecodeError
             with self.assertRaises(json.JSONDecodeError):
                 setup_logging()
 
     def test_setup_logging_empty_config(self):
         """Test logging setup with empty configuration"""
-        # Create empty config
-        test_config = {}
-
-        # Mock the open function to return our test config
-        mock_file = mock_open(read_data=json.dumps(test_config))
-        with patch("builtins.open", mock_file):
+        # Return the parsed config directly (skip JSON serialization/parsing)
+        with patch("builtins.open", mock_open(read_data="")), patch("logging_setup._decode_json", return_value={}):
             # Should raise ValueError for empty config
             with self.assertRaises(ValueError):
                 setup_logging()
 
-    def test_setup_logging_minimal_config(self):
-        """Test logging setup with minimal configuration"""
-        # Create minimal config
-        test_config = {
-            "version": 1,
-            "handlers": {"console": {"class": "logging.StreamHandler", "level": "DEBUG"}},
-            "root": {"level": "INFO", "handlers": ["console"]},
-        }
-
-        # Mock the open function to return our test config
-        mock_file = mock_open(read_data=json.dumps(test_config))
-        with patch("builtins.open", mock_file):
-            # Call setup_logging
-            setup_logging()
-
-            # Verify logging is configured
-            root_logger = logging.getLogger()
-            self.assertTrue(len(root_logger.handlers) > 0)
-
-    def test_setup_logging_no_queue_handler(self):
-        """Test logging setup without queue handler"""
-        # Create config without queue handler
-        test_config = {
-            "version": 1,
-            "handlers": {"file": {"class": "logging.FileHandler", "filename": "test.log", "level": "INFO"}},
-            "root": {"level": "INFO", "handlers": ["file"]},
-        }
-
-        # Mock the open function to return our test config
-        mock_file = mock_open(read_data=json.dumps(test_config))
-        with patch("builtins.open", mock_file):
-            # Mock the logger to have handlers without listener
-            with patch("logging_setup.logging.getLogger") as mock_get_logger:
-                mock_logger = MagicMock()
-                mock_handler = MagicMock()
-                # No listener attribute
-                mock_logger.handlers = [mock_handler]
-                mock_get_logger.return_value = mock_logger
-
-                # Should not raise exception
-                try:
-                    setup_logging()
-                except Exception as e:
-                    self.fail(f"setup_logging() raised {e} unexpectedly!")
-
-    def test_setup_logging_atexit_registration(self):
-        """Test that atexit registration works correctly"""
-        # Create test config
-        test_config = {
-            "version": 1,
-            "handlers": {"console": {"class": "logging.StreamHandler", "level": "DEBUG"}},
-            "root": {"level": "INFO", "handlers": ["console"]},
-        }
-
-        # Mock the open function to return our test config
-        mock_file = mock_open(read_data=json.dumps(test_config))
-        with patch("builtins.open", mock_file):
-            # Mock atexit.register
-            with patch("logging_setup.atexit.register"):
-                setup_logging()
-
-                # Verify atexit.register was called if queue handler exists
-                # (This test case doesn't have queue handler, so it might not be called)
-                # The actual behavior depends on the mock setup
-
 
 if __name__ == "__main__":
     unittest.main()
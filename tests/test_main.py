@@ -7,9 +7,11 @@ It tests the main functions for stock analysis and selection.
 
 import unittest
 import json
+from collections import deque
 from contextlib import ExitStack
 from datetime import datetime
-from unittest.mock import MagicMock, patch, mock_open
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import ANY, MagicMock, Mock, patch, mock_open
 
 import pandas as pd
 import main as main_module
@@ -35,50 +37,135 @@ from main import (
     update_final_items,
 )
 from sell_signals import SellDecision, SellReason
+from stock_analysis import UsaStockFinder
+
+# 테스트 간 공유되는 불변 픽스처 (테스트마다 다시 생성하지 않도록 모듈 로드 시 한 번만 생성)
+_MOCK_CORRELATIONS = {
+    "200": {"AAPL": 75.5, "MSFT": 82.3, "GOOGL": 68.9},
+    "100": {"AAPL": 71.2, "MSFT": 78.9, "GOOGL": 65.4},
+    "50": {"AAPL": 68.7, "MSFT": 76.2, "GOOGL": 62.1},
+}
+
+_EDGE_CORRELATIONS = {
+    "200": {"AAPL": 75.5, "MSFT": 82.3, "GOOGL": 68.9},
+    "100": {"AAPL": 71.2, "MSFT": 78.9, "GOOGL": 65.4},
+    "50": {"AAPL": 50.0, "MSFT": 40.0, "GOOGL": 39.9},  # Edge cases
+}
+
+# 테스트에서 반복 사용하는 종목 목록 (불변 튜플로 공유, list[str] 인자로 넘길 때는 list()로 복사)
+_AAPL_MSFT = ("AAPL", "MSFT")
+_AAPL_MSFT_GOOGL = _AAPL_MSFT + ("GOOGL",)
+_AAPL_MSFT_TSLA = _AAPL_MSFT + ("TSLA",)
+_AAPL_MSFT_GOOGL_TSLA = _AAPL_MSFT_GOOGL + ("TSLA",)
+
+# calculate_correlations가 조회하는 기간 (호출 순서)
+_EXPECTED_PERIODS = (200, 100, 50)
+
+_HOLDINGS_TSLA = (
+    {
+        "symbol": "TSLA",
+        "quantity": 20.0,
+        "avg_price": 200.0,
+        "current_price": 250.0,
+        "profit_loss": 1000.0,
+        "profit_loss_rate": 25.0,
+    },
+)
+
+
+class _FakeFinder:
+    """Minimal UsaStockFinder stand-in that replays queued results and records call arguments"""
+
+    __slots__ = ("symbols", "_correlation_results", "_trend_results", "correlation_calls", "trend_calls")
+
+    def __init__(self, symbols=_AAPL_MSFT_GOOGL, correlation_results=(), trend_results=()):
+        self.symbols = list(symbols)
+        self._correlation_results = deque(correlation_results)
+        self._trend_results = deque(trend_results)
+        self.correlation_calls = []
+        self.trend_calls = []
+
+    def price_volume_correlation_percent(self, days):
+        """Return the next queued correlation result"""
+        self.correlation_calls.append(days)
+        return self._correlation_results.popleft()
+
+    def has_valid_trend_template(self, margin):
+        """Return the next queued trend template result"""
+        self.trend_calls.append(margin)
+        return self._trend_results.popleft()
 
 
 class TestMainFunctions(unittest.TestCase):
     """Test main module functions"""
 
+    # 공유 상관관계 데이터 (읽기 전용 뷰로 노출해 테스트 간 변경 방지)
+    CORRELATIONS = MappingProxyType({period: MappingProxyType(values) for period, values in _MOCK_CORRELATIONS.items()})
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the read-only finder result sequences and broker patchers shared by the tests"""
+        # 브로커 조회 함수는 클래스 전체에서 한 번만 패치 (테스트마다 setUp에서 상태 초기화)
+        balance_patcher = patch.object(main_module, "fetch_account_balance")
+        cls.mock_fetch_balance = balance_patcher.start()
+        cls.addClassCleanup(balance_patcher.stop)
+        holdings_patcher = patch.object(main_module, "fetch_holdings_detail")
+        cls.mock_fetch_holdings = holdings_patcher.start()
+        cls.addClassCleanup(holdings_patcher.stop)
+
+        # price_volume_correlation_percent 반환값 (200, 100, 50일 순서)
+        cls.CORRELATION_SEQUENCE = (
+            _MOCK_CORRELATIONS["200"],
+            _MOCK_CORRELATIONS["100"],
+            _MOCK_CORRELATIONS["50"],
+        )
+        # has_valid_trend_template 반환값 (margin 0, margin 0.1 순서)
+        cls.TREND_BUY = (
+            {"AAPL": True, "MSFT": False, "GOOGL": True},
+            {"AAPL": True, "MSFT": True, "GOOGL": True},
+        )
+        cls.TREND_HOLD = (
+            {"AAPL": False, "MSFT": False, "GOOGL": False},
+            {"AAPL": True, "MSFT": True, "GOOGL": False},
+        )
+        cls.TREND_NONE = (
+            {"AAPL": False, "MSFT": False, "GOOGL": False},
+            {"AAPL": False, "MSFT": False, "GOOGL": False},
+        )
+        cls.TREND_ALL = (
+            {"AAPL": True, "MSFT": True, "GOOGL": True},
+            {"AAPL": True, "MSFT": True, "GOOGL": True},
+        )
+        # (name, trend results, correlations, expected buy, expected hold)
+        cls.SELECT_STOCKS_CASES = (
+            # AAPL/GOOGL: valid trend + correlation >= 50, MSFT: valid only with margin -> hold
+            ("buy_candidates", cls.TREND_BUY, cls.CORRELATIONS, ["AAPL", "GOOGL"], ["MSFT"]),
+            # AAPL/MSFT: valid trend with margin + correlation >= 40, GOOGL: invalid even with margin
+            ("hold_candidates", cls.TREND_HOLD, cls.CORRELATIONS, [], ["AAPL", "MSFT"]),
+            ("no_candidates", cls.TREND_NONE, cls.CORRELATIONS, [], []),
+            # Correlation exactly at thresholds: AAPL = 50.0 -> buy, MSFT = 40.0 -> hold, GOOGL = 39.9 -> neither
+            ("edge_case_correlations", cls.TREND_ALL, _EDGE_CORRELATIONS, ["AAPL"], ["MSFT"]),
+        )
+
     def setUp(self):
         """Set up test fixtures"""
-        # Mock UsaStockFinder instance
-        self.mock_finder = MagicMock()
-        self.mock_finder.symbols = ["AAPL", "MSFT", "GOOGL"]
-
-        # Mock correlations data
-        self.mock_correlations = {
-            "200": {"AAPL": 75.5, "MSFT": 82.3, "GOOGL": 68.9},
-            "100": {"AAPL": 71.2, "MSFT": 78.9, "GOOGL": 65.4},
-            "50": {"AAPL": 68.7, "MSFT": 76.2, "GOOGL": 62.1},
-        }
+        self.mock_fetch_balance.reset_mock(return_value=True, side_effect=True)
+        self.mock_fetch_holdings.reset_mock(return_value=True, side_effect=True)
 
     def test_calculate_correlations(self):
         """Test calculate_correlations function"""
-        # Mock the price_volume_correlation_percent method
-        self.mock_finder.price_volume_correlation_percent.side_effect = [
-            {"AAPL": 75.5, "MSFT": 82.3, "GOOGL": 68.9},  # 200 days
-            {"AAPL": 71.2, "MSFT": 78.9, "GOOGL": 65.4},  # 100 days
-            {"AAPL": 68.7, "MSFT": 76.2, "GOOGL": 62.1},  # 50 days
-        ]
+        # Queue price_volume_correlation_percent results (200, 100, 50 days)
+        finder = _FakeFinder(correlation_results=self.CORRELATION_SEQUENCE)
 
-        result = calculate_correlations(self.mock_finder)
+        result = calculate_correlations(finder)
 
         # Verify the result structure
         self.assertIn("200", result)
         self.assertIn("100", result)
         self.assertIn("50", result)
 
-        # Verify the finder method was called for each period
-        self.assertEqual(self.mock_finder.price_volume_correlation_percent.call_count, 3)
-
-        # Verify the calls were made with correct parameters
-        expected_calls = [
-            ((200,),),
-            ((100,),),
-            ((50,),),
-        ]
-        self.mock_finder.price_volume_correlation_percent.assert_has_calls(expected_calls)
+        # Verify the finder method was called exactly once per period, in order
+        self.assertEqual(tuple(finder.correlation_calls), _EXPECTED_PERIODS)
 
     def test_normalize_exchange_name_common_aliases(self):
         """Common provider aliases should normalize to core exchange values."""
@@ -131,56 +218,23 @@ class TestMainFunctions(unittest.TestCase):
             self.assertTrue(is_eligible, msg=f"{exchange} should be eligible")
             self.assertIsNone(skip_reason)
 
-    def test_select_stocks_buy_candidates(self):
-        """Test select_stocks function for buy candidates"""
-        # Mock the has_valid_trend_template method
-        self.mock_finder.has_valid_trend_template.side_effect = [
-            {"AAPL": True, "MSFT": False, "GOOGL": True},  # margin 0
-            {"AAPL": True, "MSFT": True, "GOOGL": True},  # margin 0.1
-        ]
-
-        buy_items, not_sell_items = select_stocks(self.mock_finder, self.mock_correlations)
-
-        # AAPL and GOOGL should be in buy_items (valid trend + correlation >= 50)
-        self.assertIn("AAPL", buy_items)
-        self.assertIn("GOOGL", buy_items)
-        # MSFT should not be in buy_items (invalid trend)
-        self.assertNotIn("MSFT", buy_items)
-
-    def test_select_stocks_hold_candidates(self):
-        """Test select_stocks function for hold candidates"""
-        # Mock the has_valid_trend_template method
-        self.mock_finder.has_valid_trend_template.side_effect = [
-            {"AAPL": False, "MSFT": False, "GOOGL": False},  # margin 0
-            {"AAPL": True, "MSFT": True, "GOOGL": False},  # margin 0.1
-        ]
-
-        buy_items, not_sell_items = select_stocks(self.mock_finder, self.mock_correlations)
-
-        # AAPL and MSFT should be in not_sell_items (valid trend with margin + correlation >= 40)
-        self.assertIn("AAPL", not_sell_items)
-        self.assertIn("MSFT", not_sell_items)
-        # GOOGL should not be in not_sell_items (invalid trend even with margin)
-
-    def test_select_stocks_no_candidates(self):
-        """Test select_stocks function with no valid candidates"""
-        # Mock the has_valid_trend_template method to return all False
-        self.mock_finder.has_valid_trend_template.side_effect = [
-            {"AAPL": False, "MSFT": False, "GOOGL": False},  # margin 0
-            {"AAPL": False, "MSFT": False, "GOOGL": False},  # margin 0.1
-        ]
+    def test_select_stocks_variants(self):
+        """Test select_stocks buy/hold classification across trend and correlation scenarios"""
+        for name, trend_results, correlations, expected_buy, expected_hold in self.SELECT_STOCKS_CASES:
+            with self.subTest(name=name):
+                # Queue has_valid_trend_template results
+                finder = _FakeFinder(trend_results=trend_results)
 
-        buy_items, not_sell_items = select_stocks(self.mock_finder, self.mock_correlations)
+                buy_items, not_sell_items = select_stocks(finder, correlations)
 
-        # Both lists should be empty
-        self.assertEqual(len(buy_items), 0)
-        self.assertEqual(len(not_sell_items), 0)
+                self.assertEqual(buy_items, expected_buy)
+                self.assertEqual(not_sell_items, expected_hold)
 
     def test_generate_telegram_message_with_changes(self):
         """Test generate_telegram_message function with portfolio changes"""
-        prev_items = ["AAPL", "MSFT", "GOOGL"]
-        buy_items = ["AAPL", "MSFT", "TSLA"]
-        not_sell_items = ["AAPL", "MSFT", "GOOGL"]
+        prev_items = list(_AAPL_MSFT_GOOGL)
+        buy_items = list(_AAPL_MSFT_TSLA)
+        not_sell_items = list(_AAPL_MSFT_GOOGL)
 
         result = generate_telegram_message(prev_items, buy_items, not_sell_items)
 
@@ -193,9 +247,9 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_generate_telegram_message_with_sell_signals(self):
         """Test generate_telegram_message function with sell signals"""
-        prev_items = ["AAPL", "MSFT", "GOOGL", "TSLA"]
-        buy_items = ["AAPL", "MSFT"]
-        not_sell_items = ["AAPL", "MSFT", "GOOGL"]
+        prev_items = list(_AAPL_MSFT_GOOGL_TSLA)
+        buy_items = list(_AAPL_MSFT)
+        not_sell_items = list(_AAPL_MSFT_GOOGL)
 
         # TSLA is not in buy_items or not_sell_items, so it should be sold due to trend
         sell_decisions = {"TSLA": SellDecision("TSLA", SellReason.TREND, 100.0)}
@@ -210,9 +264,9 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_generate_telegram_message_no_changes(self):
         """Test generate_telegram_message function with no changes"""
-        prev_items = ["AAPL", "MSFT", "GOOGL"]
-        buy_items = ["AAPL", "MSFT", "GOOGL"]
-        not_sell_items = ["AAPL", "MSFT", "GOOGL"]
+        prev_items = list(_AAPL_MSFT_GOOGL)
+        buy_items = list(_AAPL_MSFT_GOOGL)
+        not_sell_items = list(_AAPL_MSFT_GOOGL)
 
         result = generate_telegram_message(prev_items, buy_items, not_sell_items)
 
@@ -221,9 +275,9 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_update_final_items(self):
         """Test update_final_items function"""
-        prev_items = ["AAPL", "MSFT", "GOOGL"]
-        buy_items = ["AAPL", "MSFT", "TSLA"]
-        not_sell_items = ["AAPL", "MSFT", "GOOGL"]
+        prev_items = list(_AAPL_MSFT_GOOGL)
+        buy_items = list(_AAPL_MSFT_TSLA)
+        not_sell_items = list(_AAPL_MSFT_GOOGL)
 
         result = update_final_items(prev_items, buy_items, not_sell_items)
 
@@ -233,9 +287,9 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_update_final_items_no_new_items(self):
         """Test update_final_items function with no new items"""
-        prev_items = ["AAPL", "MSFT", "GOOGL"]
-        buy_items = ["AAPL", "MSFT"]
-        not_sell_items = ["AAPL", "MSFT", "GOOGL"]
+        prev_items = list(_AAPL_MSFT_GOOGL)
+        buy_items = list(_AAPL_MSFT)
+        not_sell_items = list(_AAPL_MSFT_GOOGL)
 
         result = update_final_items(prev_items, buy_items, not_sell_items)
 
@@ -267,7 +321,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_filter_buy_candidates_by_event_quarantine(self):
         """Event-quarantine symbols should be removed from buy candidates."""
-        mock_finder = MagicMock()
+        mock_finder = Mock(spec=UsaStockFinder)
         mock_finder.get_event_quarantine_metrics.side_effect = [
             {
                 "is_event_quarantine": True,
@@ -293,7 +347,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_filter_buy_candidates_by_event_quarantine_protects_existing_symbols(self):
         """Existing symbols should bypass quarantine while fresh symbols are still filtered."""
-        mock_finder = MagicMock()
+        mock_finder = Mock(spec=UsaStockFinder)
         mock_finder.get_event_quarantine_metrics.side_effect = [
             {
                 "is_event_quarantine": True,
@@ -327,7 +381,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_filter_buy_candidates_by_special_situation(self):
         """Special-situation symbols should be removed from buy candidates."""
-        mock_finder = MagicMock()
+        mock_finder = Mock(spec=UsaStockFinder)
         mock_finder.get_special_situation_price_pinned_metrics.side_effect = [
             {
                 "is_special_situation": True,
@@ -438,21 +492,19 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertEqual(result, ["AAPL", "NVDA"])
 
-    @patch("main.logger")
+    @patch.object(main_module, "logger")
     def test_log_stock_info(self, mock_logger):
         """Test log_stock_info function"""
         symbol = "AAPL"
 
-        log_stock_info(symbol, self.mock_correlations)
+        log_stock_info(symbol, self.CORRELATIONS)
 
         # Verify logger.debug was called
         mock_logger.debug.assert_called_once()
 
     def test_calculate_correlations_empty_symbols(self):
         """Test calculate_correlations with empty symbols list"""
-        empty_finder = MagicMock()
-        empty_finder.symbols = []
-        empty_finder.price_volume_correlation_percent.return_value = {}
+        empty_finder = _FakeFinder(symbols=(), correlation_results=({}, {}, {}))
 
         result = calculate_correlations(empty_finder)
 
@@ -465,36 +517,10 @@ class TestMainFunctions(unittest.TestCase):
         for period in result.values():
             self.assertEqual(period, {})
 
-    def test_select_stocks_edge_case_correlations(self):
-        """Test select_stocks with edge case correlation values"""
-        # Mock the has_valid_trend_template method
-        self.mock_finder.has_valid_trend_template.side_effect = [
-            {"AAPL": True, "MSFT": True, "GOOGL": True},  # margin 0
-            {"AAPL": True, "MSFT": True, "GOOGL": True},  # margin 0.1
-        ]
-
-        # Test with correlation exactly at thresholds
-        edge_correlations = {
-            "200": {"AAPL": 75.5, "MSFT": 82.3, "GOOGL": 68.9},
-            "100": {"AAPL": 71.2, "MSFT": 78.9, "GOOGL": 65.4},
-            "50": {"AAPL": 50.0, "MSFT": 40.0, "GOOGL": 39.9},  # Edge cases
-        }
-
-        buy_items, not_sell_items = select_stocks(self.mock_finder, edge_correlations)
-
-        # AAPL should be in buy_items (correlation = 50.0)
-        self.assertIn("AAPL", buy_items)
-        # MSFT should be in not_sell_items (correlation = 40.0)
-        self.assertIn("MSFT", not_sell_items)
-        # GOOGL should not be in either (correlation < 40.0)
-        self.assertNotIn("GOOGL", buy_items)
-        self.assertNotIn("GOOGL", not_sell_items)
-
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_success(self, mock_fetch_balance):
+    def test_calculate_investment_per_stock_success(self):
         """Test calculate_investment_per_stock with successful balance fetch"""
         # Mock account balance
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 10000.0,
             "buyable_cash": 9500.0,
             "total_balance": 50000.0,
@@ -512,10 +538,9 @@ class TestMainFunctions(unittest.TestCase):
         self.assertAlmostEqual(result["MSFT"], expected_investment, places=2)
         self.assertAlmostEqual(result["GOOGL"], expected_investment, places=2)
 
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_with_reserve(self, mock_fetch_balance):
+    def test_calculate_investment_per_stock_with_reserve(self):
         """Test calculate_investment_per_stock with custom reserve ratio"""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 10000.0,
             "buyable_cash": 10000.0,
             "total_balance": 50000.0,
@@ -530,17 +555,17 @@ class TestMainFunctions(unittest.TestCase):
         expected_investment = 10000.0 * 0.8 / 2
         self.assertAlmostEqual(result["AAPL"], expected_investment, places=2)
 
-    @patch("main.ScheduleConfig.TIME_CHECK_ENABLED", False)
+    @patch.object(main_module.ScheduleConfig, "TIME_CHECK_ENABLED", False)
     def test_is_within_execution_window_time_check_disabled(self):
         """Should always allow execution when time check is disabled."""
         self.assertTrue(is_within_execution_window())
 
-    @patch("main.ScheduleConfig.TIME_CHECK_ENABLED", True)
-    @patch("main.ScheduleConfig.TIMEZONE", "Asia/Seoul")
-    @patch("main.ScheduleConfig.EXECUTION_HOUR", 20)
-    @patch("main.ScheduleConfig.EXECUTION_MINUTE", 0)
-    @patch("main.ScheduleConfig.EXECUTION_MARGIN_MINUTES", 10)
-    @patch("main.datetime")
+    @patch.object(main_module.ScheduleConfig, "TIME_CHECK_ENABLED", True)
+    @patch.object(main_module.ScheduleConfig, "TIMEZONE", "Asia/Seoul")
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_HOUR", 20)
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_MINUTE", 0)
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_MARGIN_MINUTES", 10)
+    @patch.object(main_module, "datetime")
     def test_is_within_execution_window_inside_and_boundaries(self, mock_datetime):
         """Should return True when current time is inside window or exactly on boundaries."""
         mock_datetime.combine.side_effect = datetime.combine
@@ -557,12 +582,12 @@ class TestMainFunctions(unittest.TestCase):
         mock_datetime.now.return_value = datetime(2026, 1, 1, 20, 10, 0)
         self.assertTrue(is_within_execution_window())
 
-    @patch("main.ScheduleConfig.TIME_CHECK_ENABLED", True)
-    @patch("main.ScheduleConfig.TIMEZONE", "Asia/Seoul")
-    @patch("main.ScheduleConfig.EXECUTION_HOUR", 20)
-    @patch("main.ScheduleConfig.EXECUTION_MINUTE", 0)
-    @patch("main.ScheduleConfig.EXECUTION_MARGIN_MINUTES", 10)
-    @patch("main.datetime")
+    @patch.object(main_module.ScheduleConfig, "TIME_CHECK_ENABLED", True)
+    @patch.object(main_module.ScheduleConfig, "TIMEZONE", "Asia/Seoul")
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_HOUR", 20)
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_MINUTE", 0)
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_MARGIN_MINUTES", 10)
+    @patch.object(main_module, "datetime")
     def test_is_within_execution_window_outside_window(self, mock_datetime):
         """Should return False when current time is outside execution window."""
         mock_datetime.combine.side_effect = datetime.combine
@@ -570,12 +595,12 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertFalse(is_within_execution_window())
 
-    @patch("main.ScheduleConfig.TIME_CHECK_ENABLED", True)
-    @patch("main.ScheduleConfig.TIMEZONE", "Asia/Seoul")
-    @patch("main.ScheduleConfig.EXECUTION_HOUR", 0)
-    @patch("main.ScheduleConfig.EXECUTION_MINUTE", 5)
-    @patch("main.ScheduleConfig.EXECUTION_MARGIN_MINUTES", 10)
-    @patch("main.datetime")
+    @patch.object(main_module.ScheduleConfig, "TIME_CHECK_ENABLED", True)
+    @patch.object(main_module.ScheduleConfig, "TIMEZONE", "Asia/Seoul")
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_HOUR", 0)
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_MINUTE", 5)
+    @patch.object(main_module.ScheduleConfig, "EXECUTION_MARGIN_MINUTES", 10)
+    @patch.object(main_module, "datetime")
     def test_is_within_execution_window_crossing_midnight(self, mock_datetime):
         """Should handle execution windows that cross midnight."""
         mock_datetime.combine.side_effect = datetime.combine
@@ -592,10 +617,9 @@ class TestMainFunctions(unittest.TestCase):
         mock_datetime.now.return_value = datetime(2026, 1, 1, 0, 16, 0)
         self.assertFalse(is_within_execution_window())
 
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_with_min_investment(self, mock_fetch_balance):
+    def test_calculate_investment_per_stock_with_min_investment(self):
         """Test calculate_investment_per_stock with minimum investment constraint"""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 1000.0,
             "buyable_cash": 1000.0,
             "total_balance": 5000.0,
@@ -611,10 +635,26 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_with_max_investment(self, mock_fetch_balance):
+    def test_calculate_investment_per_stock_nan_balance_returns_none(self):
+        """A NaN balance field must not size every candidate with a NaN investment"""
+        cases = (
+            ("equal_nan_buyable_cash", "equal", {"available_cash": 1000.0, "buyable_cash": float("nan")}),
+            (
+                "proportional_nan_total_balance",
+                "proportional",
+                {"available_cash": 1000.0, "buyable_cash": 1000.0, "total_balance": float("nan")},
+            ),
+        )
+        for name, strategy, balance in cases:
+            with self.subTest(name=name), patch.object(
+                main_module.InvestmentConfig, "DISTRIBUTION_STRATEGY", strategy
+            ), patch.object(main_module.InvestmentConfig, "PROPORTIONAL_PERCENTAGE", 0.1):
+                self.mock_fetch_balance.return_value = balance
+                self.assertIsNone(calculate_investment_per_stock(["AAPL", "MSFT"], min_investment=100.0))
+
+    def test_calculate_investment_per_stock_with_max_investment(self):
         """Test calculate_investment_per_stock with maximum investment constraint"""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 10000.0,
             "buyable_cash": 10000.0,
             "total_balance": 50000.0,
@@ -628,11 +668,10 @@ class TestMainFunctions(unittest.TestCase):
         # Without max, would be 9000, but max is 5000
         self.assertLessEqual(result["AAPL"], 5000.0)
 
-    @patch("main.fetch_account_balance")
-    @patch("main.InvestmentConfig.DISTRIBUTION_STRATEGY", "equal")
-    def test_calculate_investment_per_stock_additional_cash_increases_buyable_cash(self, mock_fetch_balance):
+    @patch.object(main_module.InvestmentConfig, "DISTRIBUTION_STRATEGY", "equal")
+    def test_calculate_investment_per_stock_additional_cash_increases_buyable_cash(self):
         """Additional cash should increase effective buyable cash before sizing."""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 100.0,
             "buyable_cash": 100.0,
             "total_balance": 1000.0,
@@ -648,12 +687,11 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertEqual(result, {"AAPL": 100.0, "MSFT": 100.0})
 
-    @patch("main.fetch_account_balance")
-    @patch("main.InvestmentConfig.PROPORTIONAL_PERCENTAGE", 0.1)
-    @patch("main.InvestmentConfig.DISTRIBUTION_STRATEGY", "proportional")
-    def test_calculate_investment_per_stock_proportional_distribution(self, mock_fetch_balance):
+    @patch.object(main_module.InvestmentConfig, "PROPORTIONAL_PERCENTAGE", 0.1)
+    @patch.object(main_module.InvestmentConfig, "DISTRIBUTION_STRATEGY", "proportional")
+    def test_calculate_investment_per_stock_proportional_distribution(self):
         """Proportional strategy should use total balance percentage per stock."""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 10000.0,
             "buyable_cash": 9000.0,
             "total_balance": 50000.0,
@@ -665,12 +703,11 @@ class TestMainFunctions(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result, {"AAPL": 5000.0, "MSFT": 5000.0, "GOOGL": 5000.0})
 
-    @patch("main.fetch_account_balance")
-    @patch("main.InvestmentConfig.PROPORTIONAL_PERCENTAGE", 0.2)
-    @patch("main.InvestmentConfig.DISTRIBUTION_STRATEGY", "proportional")
-    def test_calculate_investment_per_stock_proportional_distribution_with_max_cap(self, mock_fetch_balance):
+    @patch.object(main_module.InvestmentConfig, "PROPORTIONAL_PERCENTAGE", 0.2)
+    @patch.object(main_module.InvestmentConfig, "DISTRIBUTION_STRATEGY", "proportional")
+    def test_calculate_investment_per_stock_proportional_distribution_with_max_cap(self):
         """Proportional sizing should still respect max investment cap."""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 10000.0,
             "buyable_cash": 9000.0,
             "total_balance": 50000.0,
@@ -685,13 +722,10 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertEqual(result, {"AAPL": 6000.0, "MSFT": 6000.0})
 
-    @patch("main.fetch_account_balance")
-    @patch("main.InvestmentConfig.DISTRIBUTION_STRATEGY", "equal")
-    def test_calculate_investment_per_stock_equal_distribution_min_filtering_is_all_or_nothing(
-        self, mock_fetch_balance
-    ):
+    @patch.object(main_module.InvestmentConfig, "DISTRIBUTION_STRATEGY", "equal")
+    def test_calculate_investment_per_stock_equal_distribution_min_filtering_is_all_or_nothing(self):
         """Equal-distribution min filtering currently behaves as all-or-nothing across candidates."""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 500.0,
             "buyable_cash": 500.0,
             "total_balance": 500.0,
@@ -709,10 +743,9 @@ class TestMainFunctions(unittest.TestCase):
         # NOTE: Mixed-subset affordability could be explored in a future behavior-change PR.
         self.assertIsNone(result)
 
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_no_balance(self, mock_fetch_balance):
+    def test_calculate_investment_per_stock_no_balance(self):
         """Test calculate_investment_per_stock when balance fetch fails"""
-        mock_fetch_balance.return_value = None
+        self.mock_fetch_balance.return_value = None
 
         buy_items = ["AAPL", "MSFT"]
 
@@ -720,17 +753,15 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_no_buy_items(self, _mock_fetch_balance):
+    def test_calculate_investment_per_stock_no_buy_items(self):
         """Test calculate_investment_per_stock with empty buy items"""
         result = calculate_investment_per_stock([])
 
         self.assertIsNone(result)
 
-    @patch("main.fetch_account_balance")
-    def test_calculate_investment_per_stock_insufficient_cash(self, mock_fetch_balance):
+    def test_calculate_investment_per_stock_insufficient_cash(self):
         """Test calculate_investment_per_stock with insufficient cash"""
-        mock_fetch_balance.return_value = {
+        self.mock_fetch_balance.return_value = {
             "available_cash": 50.0,
             "buyable_cash": 50.0,
             "total_balance": 100.0,
@@ -744,15 +775,13 @@ class TestMainFunctions(unittest.TestCase):
 
         self.assertIsNone(result)
 
-    @patch("main.fetch_holdings_detail")
-    def test_calculate_share_quantities_success(self, mock_fetch_holdings):
+    def test_calculate_share_quantities_success(self):
         """Test calculate_share_quantities with successful calculation"""
-        # Mock finder
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"AAPL": 150.0, "MSFT": 300.0}
+        # Finder stub (only current_price is read)
+        mock_finder = SimpleNamespace(current_price={"AAPL": 150.0, "MSFT": 300.0})
 
         # Mock holdings
-        mock_fetch_holdings.return_value = [
+        self.mock_fetch_holdings.return_value = [
             {"symbol": "AAPL", "quantity": 10.0, "avg_price": 140.0, "current_price": 150.0}
         ]
 
@@ -783,8 +812,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_share_quantities_filters_symbol_when_existing_holding_above_target(self):
         """Symbol should be filtered out when current holding already exceeds target quantity."""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"AAPL": 100.0}
+        mock_finder = SimpleNamespace(current_price={"AAPL": 100.0})
 
         investment_map = {"AAPL": 500.0}  # target_total_quantity = 5
         current_holdings = [{"symbol": "AAPL", "quantity": 8.0}]
@@ -795,8 +823,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_share_quantities_skips_invalid_current_price(self):
         """Invalid current price should cause symbol to be skipped."""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"AAPL": 0.0}
+        mock_finder = SimpleNamespace(current_price={"AAPL": 0.0})
 
         investment_map = {"AAPL": 1000.0}
         current_holdings = []
@@ -807,8 +834,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_share_quantities_skips_too_small_investment_amount(self):
         """Too-small investment that results in zero shares should be skipped."""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"AAPL": 1000.0}
+        mock_finder = SimpleNamespace(current_price={"AAPL": 1000.0})
 
         investment_map = {"AAPL": 10.0}  # target_total_quantity = 0
         current_holdings = []
@@ -819,8 +845,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_share_quantities_returns_partial_result_when_one_symbol_is_skipped(self):
         """Should return only valid symbol when another symbol is skipped."""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"AAPL": 100.0, "MSFT": 0.0}
+        mock_finder = SimpleNamespace(current_price={"AAPL": 100.0, "MSFT": 0.0})
 
         investment_map = {"AAPL": 1000.0, "MSFT": 1000.0}
         current_holdings = []
@@ -832,24 +857,13 @@ class TestMainFunctions(unittest.TestCase):
         self.assertEqual(result["AAPL"]["shares_to_buy"], 10)
         self.assertNotIn("MSFT", result)
 
-    @patch("main.fetch_holdings_detail")
-    def test_calculate_sell_quantities_success(self, mock_fetch_holdings):
+    def test_calculate_sell_quantities_success(self):
         """Test calculate_sell_quantities with successful calculation"""
-        # Mock finder
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"TSLA": 250.0}
+        # Finder stub (only current_price is read)
+        mock_finder = SimpleNamespace(current_price={"TSLA": 250.0})
 
         # Mock holdings
-        mock_fetch_holdings.return_value = [
-            {
-                "symbol": "TSLA",
-                "quantity": 20.0,
-                "avg_price": 200.0,
-                "current_price": 250.0,
-                "profit_loss": 1000.0,
-                "profit_loss_rate": 25.0,
-            }
-        ]
+        self.mock_fetch_holdings.return_value = list(_HOLDINGS_TSLA)
 
         sell_items = ["TSLA"]
 
@@ -867,8 +881,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_sell_quantities_uses_finder_price_when_available(self):
         """Test sell sizing uses finder.current_price when it is positive"""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"TSLA": 250.0}
+        mock_finder = SimpleNamespace(current_price={"TSLA": 250.0})
 
         current_holdings = [
             {
@@ -889,8 +902,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_sell_quantities_falls_back_to_holdings_price(self):
         """Test sell sizing uses holding.current_price when finder price is missing or zero"""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"TSLA": 0.0}
+        mock_finder = SimpleNamespace(current_price={"TSLA": 0.0})
 
         current_holdings = [
             {
@@ -919,8 +931,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_sell_quantities_skips_symbol_missing_from_holdings(self):
         """Test symbols not in holdings are skipped"""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"TSLA": 250.0}
+        mock_finder = SimpleNamespace(current_price={"TSLA": 250.0})
 
         current_holdings = [
             {
@@ -937,8 +948,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_sell_quantities_skips_zero_quantity_holding(self):
         """Test holdings with zero quantity are skipped"""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"TSLA": 250.0}
+        mock_finder = SimpleNamespace(current_price={"TSLA": 250.0})
 
         current_holdings = [
             {
@@ -955,8 +965,7 @@ class TestMainFunctions(unittest.TestCase):
 
     def test_calculate_sell_quantities_skips_when_both_prices_invalid(self):
         """Test symbol is skipped when both finder and holdings prices are invalid"""
-        mock_finder = MagicMock()
-        mock_finder.current_price = {"TSLA": 0.0}
+        mock_finder = SimpleNamespace(current_price={"TSLA": 0.0})
 
         current_holdings = [
             {
@@ -981,8 +990,7 @@ class TestMainFunctions(unittest.TestCase):
         self.assertFalse(is_profit_loss_rate_mismatch(25.0, 25.09))  # below 0.1 => no warning
         self.assertTrue(is_profit_loss_rate_mismatch(25.0, 25.11))  # over 0.1 => warning
 
-    @patch("main.fetch_holdings_detail")
-    def test_generate_telegram_message_with_share_quantities(self, _mock_fetch_holdings):
+    def test_generate_telegram_message_with_share_quantities(self):
         """Test generate_telegram_message with share quantities"""
         prev_items = ["AAPL"]
         buy_items = ["AAPL", "MSFT"]
@@ -1001,12 +1009,12 @@ class TestMainFunctions(unittest.TestCase):
         result = generate_telegram_message(prev_items, buy_items, not_sell_items, share_quantities)
 
         self.assertIsNotNone(result)
-        # Check that message contains investment details
-        message_text = "\n".join(result)
-        self.assertIn("MSFT", message_text)
-        self.assertIn("3,000", message_text)  # Investment amount (formatted)
-        self.assertIn("10", message_text)  # Shares to buy
-        self.assertIn("300.00", message_text)  # Current price
+        # Check that the MSFT entry itself carries the investment details
+        msft_entry = next((line for line in result if "MSFT" in line), None)
+        self.assertIsNotNone(msft_entry)
+        self.assertIn("3,000", msft_entry)  # Investment amount (formatted)
+        self.assertIn("10", msft_entry)  # Shares to buy
+        self.assertIn("300.00", msft_entry)  # Current price
 
     def test_generate_telegram_message_with_avsl_sell_signal(self):
         """Test generate_telegram_message with AVSL sell signals"""
@@ -1030,10 +1038,10 @@ class TestMainFunctions(unittest.TestCase):
         result = generate_telegram_message(prev_items, buy_items, not_sell_items, None, sell_quantities, sell_decisions)
 
         self.assertIsNotNone(result)
-        message_text = "\n".join(result)
-        self.assertIn("TSLA", message_text)
-        self.assertIn("AVSL", message_text)  # AVSL signal mentioned
-        self.assertIn("5,000", message_text)  # Sell amount (formatted)
+        tsla_entry = next((line for line in result if "TSLA" in line), None)
+        self.assertIsNotNone(tsla_entry)
+        self.assertIn("AVSL", tsla_entry)  # AVSL signal mentioned
+        self.assertIn("5,000", tsla_entry)  # Sell amount (formatted)
 
     def test_generate_telegram_message_special_situation_take_profit_label(self):
         prev_items = ["AAPL", "TSLA"]
@@ -1144,7 +1152,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
 
     def test_holding_trend_exit_signal_does_not_treat_missing_template_as_exit(self):
         """Missing trend-template keys must not become explicit TREND exits."""
-        finder = MagicMock()
+        finder = Mock(spec=UsaStockFinder)
         finder.check_avsl_sell_signal.return_value = {"AAPL": False, "MISSING": False}
         finder.get_trend_template_diagnostics.return_value = {
             "AAPL": {"final_result": True, "failed_conditions": []}
@@ -1168,7 +1176,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
 
     def test_holding_trend_exit_logs_failed_conditions(self):
         """Trend-exit holdings should log relaxed trend result and failed sub-conditions."""
-        finder = MagicMock()
+        finder = Mock(spec=UsaStockFinder)
         finder.check_avsl_sell_signal.return_value = {"AAPL": False}
         finder.get_trend_template_diagnostics.return_value = {
             "AAPL": {
@@ -1210,7 +1218,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
             mock_finder_cls = stack.enter_context(patch("main.UsaStockFinder"))
             mock_calculate_correlations = stack.enter_context(patch("main.calculate_correlations"))
             mock_select_stocks = stack.enter_context(patch("main.select_stocks"))
-            mock_in_cooldown = stack.enter_context(patch("main.is_in_cooldown"))
+            mock_cooldown_set = stack.enter_context(patch("main.active_cooldown_set"))
             mock_fetch_holdings_detail = stack.enter_context(patch("main.fetch_holdings_detail"))
             mock_evaluate_sell = stack.enter_context(patch("main.evaluate_sell_decisions"))
             mock_calculate_sell_quantities = stack.enter_context(patch("main.calculate_sell_quantities"))
@@ -1246,7 +1254,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
 
             mock_calculate_correlations.return_value = {"50": {"AAPL": 55.0, "MSFT": 52.0, "TSLA": 51.0}}
             mock_select_stocks.return_value = (["MSFT", "TSLA"], ["AAPL", "TSLA"])
-            mock_in_cooldown.return_value = False
+            mock_cooldown_set.return_value = set()
             mock_fetch_holdings_detail.return_value = [{"symbol": "AAPL", "quantity": 1.0}]
             mock_evaluate_sell.return_value = {}
             mock_calculate_sell_quantities.return_value = None
@@ -1267,6 +1275,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
             mock_calculate_correlations.assert_called_once_with(mock_finder)
             mock_select_stocks.assert_called_once()
             mock_evaluate_sell.assert_called_once()
+            mock_cooldown_set.assert_called_once_with(["MSFT"], ANY)
             mock_calculate_investment.assert_called_once_with(["MSFT"], additional_cash=0.0)
             mock_generate_message.assert_called_once()
             mock_send_telegram.assert_called_once()
@@ -1288,7 +1297,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
             mock_finder_cls = stack.enter_context(patch("main.UsaStockFinder"))
             stack.enter_context(patch("main.calculate_correlations", return_value={"50": {"AAPL": 55.0, "NEW1": 55.0}}))
             stack.enter_context(patch("main.select_stocks", return_value=(["AAPL", "NEW1"], [])))
-            stack.enter_context(patch("main.is_in_cooldown", return_value=False))
+            stack.enter_context(patch("main.active_cooldown_set", return_value=set()))
             stack.enter_context(patch("main._filter_buy_candidates_by_special_situation", return_value=(["AAPL"], [])))
             stack.enter_context(patch("main.fetch_holdings_detail", return_value=[]))
             stack.enter_context(patch("main.evaluate_sell_decisions", return_value={}))
@@ -1464,7 +1473,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
             mock_finder_cls = stack.enter_context(patch("main.UsaStockFinder"))
             stack.enter_context(patch("main.calculate_correlations", return_value={"50": {"AAPL": 55.0, "MSFT": 55.0}}))
             stack.enter_context(patch("main.select_stocks", return_value=(["AAPL", "MSFT"], [])))
-            mock_in_cooldown = stack.enter_context(patch("main.is_in_cooldown"))
+            mock_cooldown_set = stack.enter_context(patch("main.active_cooldown_set"))
             stack.enter_context(patch("main.fetch_holdings_detail", return_value=[{"symbol": "AAPL", "quantity": 1.0}]))
             mock_evaluate_sell = stack.enter_context(patch("main.evaluate_sell_decisions", return_value={}))
             stack.enter_context(patch("main.calculate_sell_quantities", return_value=None))
@@ -1476,7 +1485,8 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
             stack.enter_context(patch("main.save_json"))
 
             mock_execution_window.return_value = True
-            mock_in_cooldown.side_effect = lambda symbol, _today: symbol == "MSFT"
+            # 전달된 매수 후보 중 MSFT만 쿨다운 상태로 응답
+            mock_cooldown_set.side_effect = lambda symbols, _today: set(symbols) & {"MSFT"}
 
             mock_finder = MagicMock()
             mock_finder.is_data_valid.return_value = True
@@ -1494,6 +1504,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
 
             main()
 
+            mock_cooldown_set.assert_called_once_with(["AAPL", "MSFT"], ANY)
             self.assertTrue(mock_evaluate_sell.called)
             self.assertEqual(mock_evaluate_sell.call_args.kwargs["selected_buy"], ["AAPL"])
 
@@ -1513,7 +1524,7 @@ class TestMainOrchestrationSmoke(unittest.TestCase):
             mock_finder_cls = stack.enter_context(patch("main.UsaStockFinder"))
             stack.enter_context(patch("main.calculate_correlations", return_value={"50": {"AAPL": 60.0, "MSFT": 60.0}}))
             stack.enter_context(patch("main.select_stocks", return_value=(["MSFT"], ["AAPL"])))
-            stack.enter_context(patch("main.is_in_cooldown", return_value=False))
+            stack.enter_context(patch("main.active_cooldown_set", return_value=set()))
             stack.enter_context(patch("main.fetch_holdings_detail", return_value=[{"symbol": "TSLA", "quantity": 2.0}]))
             stack.enter_context(
                 patch(
@@ -0,0 +1,23 @@
+"""Tests for the read_csv_first_column profiling smoke driver."""
+
+import os
+import tempfile
+import unittest
+
+from tools.profile_read_csv import profile_read, write_fixture_csv
+
+
+class TestProfileReadCsv(unittest.TestCase):
+    def test_profile_read_on_1000_row_fixture(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "large_portfolio.csv")
+            write_fixture_csv(path, 1000)
+
+            count, stats = profile_read(path, repeat=2)
+
+        self.assertEqual(count, 1000)
+        self.assertIn("read_csv_first_column", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,22 +8,28 @@ a -19% loss should trigger a stop loss sell regardless of other conditions.
 
 import unittest
 from datetime import date
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, patch
 
 import sell_signals
 from sell_signals import SellReason, evaluate_sell_decisions, select_current_price
 
+# 단일 보유 종목 테스트용 읽기 전용 템플릿
+# 각 테스트는 {**_BASE_HOLDING, ...}로 복사 후 필요한 필드만 덮어씀
+_BASE_HOLDING = MappingProxyType({"symbol": "TEST", "quantity": 100.0, "avg_price": 100.0, "current_price": 100.0})
+
 
 class TestSellSignals(unittest.TestCase):
     """Test sell signals module"""
 
     def setUp(self):
         """Set up test fixtures"""
-        # Mock UsaStockFinder instance
-        self.mock_finder = MagicMock()
-        self.mock_finder.current_price = {}
-        self.mock_finder.is_special_situation_price_pinned.return_value = False
-        self.mock_finder.get_atr.return_value = 0.0
+        # UsaStockFinder stub: plain current_price dict plus the two methods the evaluator calls
+        self.mock_finder = SimpleNamespace(
+            current_price={},
+            is_special_situation_price_pinned=Mock(return_value=False),
+            get_atr=Mock(return_value=0.0),
+        )
 
     def test_select_current_price_prefers_positive_finder_price(self):
         """Helper should use finder price when it is positive."""
@@ -198,185 +204,53 @@ class TestSellSignals(unittest.TestCase):
         self.assertEqual(decision.reason, SellReason.STOP_LOSS, "Stop loss should take priority over AVSL")
         self.assertEqual(decision.quantity, quantity)
 
-    def test_stop_loss_threshold(self):
-        """Test stop loss threshold at exactly 10% loss"""
-        symbol = "TEST"
-        avg_price = 100.0
-        quantity = 100.0
-
-        # Test case 1: Exactly -10% loss (should trigger stop loss)
-        current_price = 90.0  # Exactly -10%
-        self.mock_finder.current_price = {symbol: current_price}
-
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": avg_price,
-                "current_price": current_price,
-            }
-        ]
-
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[],
-            selected_not_sell=[],
-            avsl_signals={symbol: False},
-            holding_trend_exit_signals={symbol: True},
-        )
-
-        self.assertEqual(decisions[symbol].reason, SellReason.STOP_LOSS)
-
-        # Test case 2: -9.9% loss (should NOT trigger stop loss)
-        current_price = 90.1  # -9.9%
-        self.mock_finder.current_price = {symbol: current_price}
-        holdings[0]["current_price"] = current_price
-
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[],
-            selected_not_sell=[],
-            avsl_signals={symbol: False},
-        )
-
-        # Should hold without explicit trend-exit signal
-        self.assertEqual(decisions[symbol].reason, SellReason.NONE)
-
-        # Test case 3: explicit trend-exit should trigger TREND sell
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[],
-            selected_not_sell=[],
-            avsl_signals={symbol: False},
-            holding_trend_exit_signals={symbol: True},
-        )
-
-        # Should trigger trend sell only with explicit signal
-        self.assertEqual(decisions[symbol].reason, SellReason.TREND)
-
-    def test_avsl_sell_signal(self):
-        """Test AVSL sell signal (2nd tier)"""
-        symbol = "TEST"
-        avg_price = 100.0
-        current_price = 95.0  # -5% loss (below stop loss threshold)
-        quantity = 100.0
-
-        self.mock_finder.current_price = {symbol: current_price}
-
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": avg_price,
-                "current_price": current_price,
-            }
-        ]
-
-        # AVSL signal present, not in buy/not_sell lists
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[],
-            selected_not_sell=[],
-            avsl_signals={symbol: True},
-        )
-
-        self.assertEqual(decisions[symbol].reason, SellReason.AVSL)
-        self.assertEqual(decisions[symbol].quantity, quantity)
-
-    def test_trend_sell_signal(self):
-        """Test trend sell signal (3rd tier)"""
-        symbol = "TEST"
-        avg_price = 100.0
-        current_price = 95.0  # -5% loss
-        quantity = 100.0
-
-        self.mock_finder.current_price = {symbol: current_price}
-
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": avg_price,
-                "current_price": current_price,
-            }
-        ]
-
-        # No AVSL signal, not in buy/not_sell lists
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[],
-            selected_not_sell=[],
-            avsl_signals={symbol: False},
-            holding_trend_exit_signals={symbol: True},
-        )
-
-        self.assertEqual(decisions[symbol].reason, SellReason.TREND)
-        self.assertEqual(decisions[symbol].quantity, quantity)
-
-    def test_hold_decision(self):
-        """Test hold decision when stock meets criteria"""
-        symbol = "TEST"
-        avg_price = 100.0
-        current_price = 105.0  # +5% gain
-        quantity = 100.0
-
-        self.mock_finder.current_price = {symbol: current_price}
-
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": avg_price,
-                "current_price": current_price,
-            }
-        ]
-
-        # Stock is in selected_buy, no AVSL signal
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[symbol],
-            selected_not_sell=[],
-            avsl_signals={symbol: False},
-        )
-
-        self.assertEqual(decisions[symbol].reason, SellReason.NONE)
-        self.assertEqual(decisions[symbol].quantity, 0.0)
-
-        # Stock is in selected_not_sell, no AVSL signal
-        decisions = evaluate_sell_decisions(
-            finder=self.mock_finder,
-            holdings=holdings,
-            selected_buy=[],
-            selected_not_sell=[symbol],
-            avsl_signals={symbol: False},
-        )
-
-        self.assertEqual(decisions[symbol].reason, SellReason.NONE)
-        self.assertEqual(decisions[symbol].quantity, 0.0)
+    def test_single_holding_decision_tiers(self):
+        """Test stop loss threshold, AVSL, trend and hold tiers for a single holding"""
+        symbol = _BASE_HOLDING["symbol"]
+        quantity = _BASE_HOLDING["quantity"]
+        # (current_price, selected_buy, selected_not_sell, avsl, trend_exit, expected_reason, expected_quantity)
+        cases = (
+            # 정확히 -10%: 손절 발동
+            (90.0, [], [], False, True, SellReason.STOP_LOSS, quantity),
+            # -9.9%: 손절 미발동, 추세 이탈 신호 없으면 보유
+            (90.1, [], [], False, False, SellReason.NONE, 0.0),
+            # -9.9% + 명시적 추세 이탈 신호: TREND 매도
+            (90.1, [], [], False, True, SellReason.TREND, quantity),
+            # -5% + AVSL 신호: 2단계 AVSL 매도
+            (95.0, [], [], True, False, SellReason.AVSL, quantity),
+            # -5% + 추세 이탈 신호: 3단계 TREND 매도
+            (95.0, [], [], False, True, SellReason.TREND, quantity),
+            # +5%, selected_buy 포함: 보유
+            (105.0, [symbol], [], False, False, SellReason.NONE, 0.0),
+            # +5%, selected_not_sell 포함: 보유
+            (105.0, [], [symbol], False, False, SellReason.NONE, 0.0),
+        )
+
+        for current_price, selected_buy, selected_not_sell, avsl, trend_exit, reason, expected_qty in cases:
+            with self.subTest(current_price=current_price, avsl=avsl, trend_exit=trend_exit, expected=reason):
+                self.mock_finder.current_price[symbol] = current_price
+
+                decisions = evaluate_sell_decisions(
+                    finder=self.mock_finder,
+                    holdings=[{**_BASE_HOLDING, "current_price": current_price}],
+                    selected_buy=selected_buy,
+                    selected_not_sell=selected_not_sell,
+                    avsl_signals={symbol: avsl},
+                    holding_trend_exit_signals={symbol: trend_exit},
+                )
+
+                self.assertEqual(decisions[symbol].reason, reason)
+                self.assertEqual(decisions[symbol].quantity, expected_qty)
 
     def test_zero_quantity_hold(self):
         """Test that stocks with zero quantity are held"""
-        symbol = "TEST"
-        avg_price = 100.0
+        symbol = _BASE_HOLDING["symbol"]
         current_price = 81.0  # -19% loss
         quantity = 0.0  # No shares
 
         self.mock_finder.current_price = {symbol: current_price}
 
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": avg_price,
-                "current_price": current_price,
-            }
-        ]
+        holdings = [{**_BASE_HOLDING, "quantity": quantity, "current_price": current_price}]
 
         decisions = evaluate_sell_decisions(
             finder=self.mock_finder,
@@ -396,22 +270,13 @@ class TestSellSignals(unittest.TestCase):
         2. AVSL
         3. Trend
         """
-        symbol = "TEST"
-        avg_price = 100.0
-        quantity = 100.0
+        symbol = _BASE_HOLDING["symbol"]
 
         # Test: Stop loss takes priority over AVSL
         current_price = 81.0  # -19% loss
         self.mock_finder.current_price = {symbol: current_price}
 
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": avg_price,
-                "current_price": current_price,
-            }
-        ]
+        holdings = [{**_BASE_HOLDING, "current_price": current_price}]
 
         decisions = evaluate_sell_decisions(
             finder=self.mock_finder,
@@ -426,7 +291,7 @@ class TestSellSignals(unittest.TestCase):
 
         # Test: AVSL takes priority over Trend
         current_price = 95.0  # -5% loss (below stop loss)
-        self.mock_finder.current_price = {symbol: current_price}
+        self.mock_finder.current_price[symbol] = current_price
         holdings[0]["current_price"] = current_price
 
         decisions = evaluate_sell_decisions(
@@ -506,7 +371,6 @@ class TestSellSignals(unittest.TestCase):
 
         # 손익률 검증
         self.assertLess(loss_pct, -0.10, "Loss should exceed 10% threshold")
-        self.assertLessEqual(loss_pct, -0.10, "Loss should be <= -10%")
 
     def test_price_validation_edge_cases(self):
         """Test edge cases for price validation"""
@@ -536,15 +400,9 @@ class TestSellSignals(unittest.TestCase):
         self.assertEqual(decisions[symbol].reason, SellReason.NONE)
 
         # Test case 2: current_price = 0 (should skip stop loss check)
-        self.mock_finder.current_price = {symbol: 0.0}
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": 100.0,
-                "current_price": 0.0,  # Invalid current_price
-            }
-        ]
+        self.mock_finder.current_price[symbol] = 0.0
+        holdings[0]["avg_price"] = 100.0
+        holdings[0]["current_price"] = 0.0  # Invalid current_price
 
         decisions = evaluate_sell_decisions(
             finder=self.mock_finder,
@@ -559,15 +417,8 @@ class TestSellSignals(unittest.TestCase):
 
         # Test case 3: finder.current_price가 없고 holdings.current_price만 있는 경우
         # 코드는 holding.current_price를 fallback으로 사용하므로 Stop Loss가 정상 동작해야 함
-        self.mock_finder.current_price = {}  # finder에 가격 없음
-        holdings = [
-            {
-                "symbol": symbol,
-                "quantity": quantity,
-                "avg_price": 100.0,
-                "current_price": 81.0,  # -19% loss
-            }
-        ]
+        self.mock_finder.current_price.clear()  # finder에 가격 없음
+        holdings[0]["current_price"] = 81.0  # -19% loss
 
         decisions = evaluate_sell_decisions(
             finder=self.mock_finder,
@@ -868,13 +719,14 @@ class TestTrailingActivationPersistence(unittest.TestCase):
         self.symbol = "BVS"
         self.quantity = 10.0
         self.avg_price = 100.0
-        self.finder = MagicMock()
-        self.finder.current_price = {}
-        self.finder.get_atr.return_value = 100.0
-        self.finder.is_special_situation_price_pinned.return_value = False
+        self.finder = SimpleNamespace(
+            current_price={},
+            get_atr=Mock(return_value=100.0),
+            is_special_situation_price_pinned=Mock(return_value=False),
+        )
 
     def _evaluate(self, current_price: float, trailing_state: dict):
-        self.finder.current_price = {self.symbol: current_price}
+        self.finder.current_price[self.symbol] = current_price
         holdings = [
             {
                 "symbol": self.symbol,
@@ -991,10 +843,11 @@ class TestSellDecisionPriorityRegression(unittest.TestCase):
                 "current_price": 95.0,
             }
         ]
-        self.finder = MagicMock()
-        self.finder.current_price = {self.symbol: 95.0}
-        self.finder.get_atr.return_value = 0.0
-        self.finder.is_special_situation_price_pinned.return_value = False
+        self.finder = SimpleNamespace(
+            current_price={self.symbol: 95.0},
+            get_atr=Mock(return_value=0.0),
+            is_special_situation_price_pinned=Mock(return_value=False),
+        )
 
     def _run_decision(
         self,
@@ -1018,7 +871,7 @@ class TestSellDecisionPriorityRegression(unittest.TestCase):
             trailing_config.update(trailing_overrides)
 
         self.holdings[0]["current_price"] = current_price
-        self.finder.current_price = {self.symbol: current_price}
+        self.finder.current_price[self.symbol] = current_price
         self.finder.get_atr.return_value = trailing_config["atr_value"]
 
         with patch("sell_signals.load_trailing_state", return_value={}), \
@@ -2,6 +2,7 @@
 test function to test UsaStockFinder class
 """
 
+import copy
 import unittest
 from unittest.mock import patch
 
@@ -32,42 +33,47 @@ def _deterministic_ohlcv(periods: int = 100, symbol: str = "TEST") -> pd.DataFra
         },
         index=index,
     )
-    data.columns = pd.MultiIndex.from_tuples(data.columns)
     return data
 
 
 class TestUsaStockFinder(unittest.TestCase):
     """Test UsaStockFinder class"""
 
-    def setUp(self):
-        """Set up test fixtures, if any."""
-        # Mock download inside the setUp using a context manager
+    @classmethod
+    def setUpClass(cls):
+        """Build the 250-day mock download and the shared finder once per class."""
         with patch("yfinance.download") as mock_download:
             # Simulate 250 days of data
             periods = 250
             index = pd.date_range(start="2023-01-01", periods=periods, freq="D")
 
-            # Generate more data for testing moving averages
+            # Generate more data for testing moving averages (고정 시드로 재현 가능한 난수)
+            rng = np.random.default_rng(0)
+            prices = rng.random((6, periods)) * 100
             mock_data = pd.DataFrame(
                 {
-                    ("High", "AAPL"): np.random.random(periods) * 100 + 150,
-                    ("Low", "AAPL"): np.random.random(periods) * 100 + 145,
-                    ("Close", "AAPL"): np.random.random(periods) * 100 + 148,
-                    ("Volume", "AAPL"): np.random.randint(1000, 2000, periods),
-                    ("High", "MSFT"): np.random.random(periods) * 100 + 300,
-                    ("Low", "MSFT"): np.random.random(periods) * 100 + 290,
-                    ("Close", "MSFT"): np.random.random(periods) * 100 + 295,
-                    ("Volume", "MSFT"): np.random.randint(1500, 2500, periods),
+                    ("High", "AAPL"): prices[0] + 150,
+                    ("Low", "AAPL"): prices[1] + 145,
+                    ("Close", "AAPL"): prices[2] + 148,
+                    ("Volume", "AAPL"): rng.integers(1000, 2000, periods),
+                    ("High", "MSFT"): prices[3] + 300,
+                    ("Low", "MSFT"): prices[4] + 290,
+                    ("Close", "MSFT"): prices[5] + 295,
+                    ("Volume", "MSFT"): rng.integers(1500, 2500, periods),
                 },
                 index=index,
             )
 
-            # Set MultiIndex to mock returned DataFrame
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
-            self.symbols = ["AAPL", "MSFT"]
-            self.finder = UsaStockFinder(self.symbols)
+            cls.symbols = ["AAPL", "MSFT"]
+            cls._shared_finder = UsaStockFinder(cls.symbols)
+
+    def setUp(self):
+        """Give each test its own view of the shared finder."""
+        # 일부 테스트가 stock_data의 마지막 종가를 덮어쓰므로 DataFrame만 테스트별로 복사
+        self.finder = copy.copy(self._shared_finder)
+        self.finder.stock_data = self._shared_finder.stock_data.copy()
 
     def test_is_data_valid(self):
         """check is_data_valid function"""
@@ -106,7 +112,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["TEST"])
@@ -142,7 +147,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["TREND"])
@@ -166,7 +170,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["SHORT"])
@@ -191,7 +194,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["TREND"])
@@ -317,7 +319,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["EWCZ"])
@@ -338,7 +339,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["TREND"])
@@ -364,7 +364,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["VOLGAP"])
@@ -391,7 +390,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["EWCZ"])
@@ -419,7 +417,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["GAPF"])
@@ -441,7 +438,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["OLDG"])
@@ -464,7 +460,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["PULL"])
@@ -485,7 +480,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["NORM"])
@@ -553,7 +547,6 @@ class TestUsaStockFinder(unittest.TestCase):
                 },
                 index=index,
             )
-            mock_data.columns = pd.MultiIndex.from_tuples(mock_data.columns)
             mock_download.return_value = mock_data
 
             finder = UsaStockFinder(["TEST"])
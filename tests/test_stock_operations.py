@@ -12,15 +12,27 @@ from stock_operations import APIError, fetch_account_balance, fetch_holdings_det
 class TestStockOperations(unittest.TestCase):
     """Test stock_operations class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Provide dummy broker credentials for every test in the class"""
+        env_patcher = patch.dict(
+            os.environ,
+            {"ki_app_key": "test_key", "ki_app_secret_key": "test_secret", "account_number": "test_account"},
+        )
+        env_patcher.start()
+        cls.addClassCleanup(env_patcher.stop)
+
+    @staticmethod
+    def _make_broker(response: dict) -> MagicMock:
+        """Build a broker mock whose fetch_present_balance returns ``response``"""
+        mock_broker = MagicMock()
+        mock_broker.fetch_present_balance.return_value = response
+        return mock_broker
+
     @patch("stock_operations.mojito.KoreaInvestment")
     def test_fetch_us_stock_holdings_success(self, mock_korea_investment):
         """Check fetch_us_stock_holdings success"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {"rt_cd": "0", "output1": [{"pdno": "AAPL"}, {"pdno": "MSFT"}]}
+        mock_broker = self._make_broker({"rt_cd": "0", "output1": [{"pdno": "AAPL"}, {"pdno": "MSFT"}]})
         mock_korea_investment.return_value = mock_broker
 
         result = fetch_us_stock_holdings()
@@ -33,12 +45,7 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations.mojito.KoreaInvestment")
     def test_fetch_us_stock_holdings_fail(self, mock_korea_investment):
         """Check fetch_us_stock_holdings fail - should raise APIError"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {"rt_cd": "-1", "msg1": "Error fetching balance"}
+        mock_broker = self._make_broker({"rt_cd": "-1", "msg1": "Error fetching balance"})
         mock_korea_investment.return_value = mock_broker
 
         # Now raises APIError instead of returning empty list
@@ -51,21 +58,18 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_account_balance_success(self, mock_get_broker):
         """Check fetch_account_balance success"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {
-            "rt_cd": "0",
-            "output2": [
-                {
-                    "dnca_tot_amt": "1000000",  # 예수금 총액
-                    "tot_evlu_amt": "5000000",  # 총 평가 금액
-                    "nxdy_excc_amt": "950000",  # 익일 정산 금액
-                }
-            ],
-        }
+        mock_broker = self._make_broker(
+            {
+                "rt_cd": "0",
+                "output2": [
+                    {
+                        "dnca_tot_amt": "1000000",  # 예수금 총액
+                        "tot_evlu_amt": "5000000",  # 총 평가 금액
+                        "nxdy_excc_amt": "950000",  # 익일 정산 금액
+                    }
+                ],
+            }
+        )
         mock_get_broker.return_value = mock_broker
 
         result = fetch_account_balance()
@@ -79,12 +83,7 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_account_balance_fail(self, mock_get_broker):
         """Check fetch_account_balance fail - should raise APIError"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {"rt_cd": "-1", "msg1": "Error fetching balance"}
+        mock_broker = self._make_broker({"rt_cd": "-1", "msg1": "Error fetching balance"})
         mock_get_broker.return_value = mock_broker
 
         # Now raises APIError instead of returning None
@@ -94,32 +93,29 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_holdings_detail_success(self, mock_get_broker):
         """Check fetch_holdings_detail success"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {
-            "rt_cd": "0",
-            "output1": [
-                {
-                    "pdno": "AAPL-US",
-                    "prdt_name": "Apple Inc",
-                    "hldg_qty": "100",
-                    "pchs_avg_pric": "150.0",
-                    "prpr": "155.0",
-                    "evlu_amt": "15500.0",
-                },
-                {
-                    "pdno": "MSFT-US",
-                    "prdt_name": "Microsoft Corp",
-                    "hldg_qty": "50",
-                    "pchs_avg_pric": "300.0",
-                    "prpr": "305.0",
-                    "evlu_amt": "15250.0",
-                },
-            ],
-        }
+        mock_broker = self._make_broker(
+            {
+                "rt_cd": "0",
+                "output1": [
+                    {
+                        "pdno": "AAPL-US",
+                        "prdt_name": "Apple Inc",
+                        "hldg_qty": "100",
+                        "pchs_avg_pric": "150.0",
+                        "prpr": "155.0",
+                        "evlu_amt": "15500.0",
+                    },
+                    {
+                        "pdno": "MSFT-US",
+                        "prdt_name": "Microsoft Corp",
+                        "hldg_qty": "50",
+                        "pchs_avg_pric": "300.0",
+                        "prpr": "305.0",
+                        "evlu_amt": "15250.0",
+                    },
+                ],
+            }
+        )
         mock_get_broker.return_value = mock_broker
 
         result = fetch_holdings_detail()
@@ -146,12 +142,7 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_holdings_detail_fail(self, mock_get_broker):
         """Check fetch_holdings_detail fail - should raise APIError"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {"rt_cd": "-1", "msg1": "Error fetching balance"}
+        mock_broker = self._make_broker({"rt_cd": "-1", "msg1": "Error fetching balance"})
         mock_get_broker.return_value = mock_broker
 
         # Now raises APIError instead of returning None
@@ -161,12 +152,7 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_holdings_detail_empty(self, mock_get_broker):
         """Check fetch_holdings_detail with empty holdings"""
-        os.environ["ki_app_key"] = "test_key"
-        os.environ["ki_app_secret_key"] = "test_secret"
-        os.environ["account_number"] = "test_account"
-
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {"rt_cd": "0", "output1": []}
+        mock_broker = self._make_broker({"rt_cd": "0", "output1": []})
         mock_get_broker.return_value = mock_broker
 
         result = fetch_holdings_detail()
@@ -176,20 +162,21 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_account_balance_does_not_treat_krw_cash_conversion_as_usd_equity(self, mock_get_broker):
         """frcr_evlu_amt2 in output2 is KRW-converted cash, not USD total equity."""
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {
-            "rt_cd": "0",
-            "output1": [{"pdno": "AAPL-US", "cblc_qty13": "2", "ovrs_now_pric1": "150", "frcr_evlu_amt2": "300"}],
-            "output2": [
-                {
-                    "crcy_cd": "USD",
-                    "frcr_dncl_amt_2": "1003.05",
-                    "frst_bltn_exrt": "1507.2",
-                    "frcr_evlu_amt2": "1511796",
-                }
-            ],
-            "output3": [{"tot_asst_amt": "1511796"}],
-        }
+        mock_broker = self._make_broker(
+            {
+                "rt_cd": "0",
+                "output1": [{"pdno": "AAPL-US", "cblc_qty13": "2", "ovrs_now_pric1": "150", "frcr_evlu_amt2": "300"}],
+                "output2": [
+                    {
+                        "crcy_cd": "USD",
+                        "frcr_dncl_amt_2": "1003.05",
+                        "frst_bltn_exrt": "1507.2",
+                        "frcr_evlu_amt2": "1511796",
+                    }
+                ],
+                "output3": [{"tot_asst_amt": "1511796"}],
+            }
+        )
         mock_get_broker.return_value = mock_broker
 
         result = fetch_account_balance()
@@ -202,19 +189,20 @@ class TestStockOperations(unittest.TestCase):
     @patch("stock_operations._get_broker")
     def test_fetch_account_balance_deduplicates_repeated_output2_cash(self, mock_get_broker):
         """NASDAQ/NYSE calls can return the same account-level output2 row; do not double-count it."""
-        mock_broker = MagicMock()
-        mock_broker.fetch_present_balance.return_value = {
-            "rt_cd": "0",
-            "output1": [],
-            "output2": [
-                {
-                    "crcy_cd": "USD",
-                    "frcr_dncl_amt_2": "1000",
-                    "frst_bltn_exrt": "1500",
-                    "frcr_evlu_amt2": "1500000",
-                }
-            ],
-        }
+        mock_broker = self._make_broker(
+            {
+                "rt_cd": "0",
+                "output1": [],
+                "output2": [
+                    {
+                        "crcy_cd": "USD",
+                        "frcr_dncl_amt_2": "1000",
+                        "frst_bltn_exrt": "1500",
+                        "frcr_evlu_amt2": "1500000",
+                    }
+                ],
+            }
+        )
         mock_get_broker.return_value = mock_broker
 
         result = fetch_account_balance()
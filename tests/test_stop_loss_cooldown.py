@@ -18,6 +18,7 @@ from unittest.mock import patch
 
 from config import StrategyConfig
 from stop_loss_cooldown import (
+    active_cooldown_set,
     calculate_cooldown_days,
     is_in_cooldown,
     load_stop_loss_log,
@@ -31,18 +32,14 @@ class TestStopLossCooldown(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        # 임시 디렉토리와 파일 경로 생성
-        self.temp_dir = tempfile.mkdtemp()
+        # 임시 디렉토리와 파일 경로 생성 (테스트 종료 시 addCleanup으로 자동 삭제)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
         self.temp_log_path = os.path.join(self.temp_dir, "stop_loss_log.json")
         self.temp_data_dir = os.path.join(self.temp_dir, "data")
         os.makedirs(self.temp_data_dir, exist_ok=True)
 
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_load_stop_loss_log_file_not_exists(self):
         """Test loading stop loss log when file doesn't exist"""
         with patch("stop_loss_cooldown.STOP_LOSS_LOG_PATH", os.path.join(self.temp_dir, "nonexistent.json")):
@@ -139,23 +136,6 @@ class TestStopLossCooldown(unittest.TestCase):
         self.assertEqual(log[symbol]["last_stop_loss_date"], today2.isoformat())
         self.assertEqual(log[symbol]["loss_pct"], -0.25)
 
-    def test_calculate_cooldown_days_positive_or_zero_uses_base_only(self):
-        """Test that non-negative loss values always use base cooldown only"""
-        expected_base = StrategyConfig.STOP_LOSS_COOLDOWN_BASE_DAYS
-        self.assertEqual(calculate_cooldown_days(0.0), expected_base)
-        self.assertEqual(calculate_cooldown_days(0.10), expected_base)
-
-    def test_calculate_cooldown_days_negative_loss_tiers_and_cap(self):
-        """Test cooldown tiers for -15%, -25% and max-cap behavior"""
-        with (
-            patch.object(StrategyConfig, "STOP_LOSS_COOLDOWN_BASE_DAYS", 5),
-            patch.object(StrategyConfig, "STOP_LOSS_COOLDOWN_EXTRA_DAYS_PER_10PCT", 5),
-            patch.object(StrategyConfig, "STOP_LOSS_COOLDOWN_MAX_DAYS", 60),
-        ):
-            self.assertEqual(calculate_cooldown_days(-0.15), 10)
-            self.assertEqual(calculate_cooldown_days(-0.25), 15)
-            self.assertEqual(calculate_cooldown_days(-2.0), 60)  # capped from 105 to 60
-
     def test_is_in_cooldown_no_entry(self):
         """Test is_in_cooldown when symbol is not in log"""
         log_file = os.path.join(self.temp_data_dir, "stop_loss_log.json")
@@ -229,6 +209,84 @@ class TestStopLossCooldown(unittest.TestCase):
             self.assertTrue(is_in_cooldown("TEST3", today + timedelta(days=14)))  # 14일 후: 쿨다운 내
             self.assertFalse(is_in_cooldown("TEST3", today + timedelta(days=16)))  # 16일 후: 쿨다운 종료
 
+    def test_active_cooldown_set_matches_is_in_cooldown(self):
+        """Test active_cooldown_set returns exactly the symbols is_in_cooldown reports"""
+        log_file = os.path.join(self.temp_data_dir, "stop_loss_log.json")
+        today = date(2025, 1, 20)
+        log = {
+            "RECENT": {"last_stop_loss_date": "2025-01-18", "loss_pct": -0.25},  # 15일 쿨다운 중
+            "EXPIRED": {"last_stop_loss_date": "2024-12-01", "loss_pct": -0.15},  # 쿨다운 종료
+            "BROKEN": {"loss_pct": -0.25},  # 날짜 누락 → 쿨다운 아님
+        }
+        with open(log_file, "w", encoding="utf-8") as f:
+            json.dump(log, f)
+
+        with patch("stop_loss_cooldown.STOP_LOSS_LOG_PATH", log_file):
+            cooling = active_cooldown_set(log, today)
+            self.assertEqual(cooling, {"RECENT"})
+            for symbol in log:
+                self.assertEqual(symbol in cooling, is_in_cooldown(symbol, today))
+
+    def test_active_cooldown_set_empty_without_log(self):
+        """Test active_cooldown_set is empty when the log file does not exist"""
+        with patch("stop_loss_cooldown.STOP_LOSS_LOG_PATH", os.path.join(self.temp_dir, "nonexistent.json")):
+            self.assertEqual(active_cooldown_set(["AAPL"], date(2025, 1, 20)), set())
+
+    def test_active_cooldown_set_checks_only_given_symbols(self):
+        """Test active_cooldown_set ignores log entries for symbols that were not requested"""
+        log_file = os.path.join(self.temp_data_dir, "stop_loss_log.json")
+        log = {
+            "RECENT": {"last_stop_loss_date": "2025-01-18", "loss_pct": -0.25},
+            "OTHER": {"last_stop_loss_date": "2025-01-18", "loss_pct": -0.25},
+        }
+        with open(log_file, "w", encoding="utf-8") as f:
+            json.dump(log, f)
+
+        with patch("stop_loss_cooldown.STOP_LOSS_LOG_PATH", log_file):
+            self.assertEqual(active_cooldown_set(["RECENT", "AAPL"], date(2025, 1, 20)), {"RECENT"})
+
+    def test_active_cooldown_set_skips_non_dict_entries(self):
+        """Test malformed (non-dict) log entries are treated as not in cooldown instead of raising"""
+        log_file = os.path.join(self.temp_data_dir, "stop_loss_log.json")
+        log = {
+            "RECENT": {"last_stop_loss_date": "2025-01-18", "loss_pct": -0.25},
+            "STRING": "2025-01-18",
+            "LIST": ["2025-01-18", -0.25],
+        }
+        with open(log_file, "w", encoding="utf-8") as f:
+            json.dump(log, f)
+
+        with patch("stop_loss_cooldown.STOP_LOSS_LOG_PATH", log_file):
+            self.assertEqual(active_cooldown_set(log, date(2025, 1, 20)), {"RECENT"})
+            self.assertFalse(is_in_cooldown("STRING", date(2025, 1, 20)))
+
+
+class TestCalculateCooldownDays(unittest.TestCase):
+    """Test calculate_cooldown_days (pure function, no log file fixture needed)"""
+
+    def test_calculate_cooldown_days_positive_or_zero_uses_base_only(self):
+        """Test that non-negative loss values always use base cooldown only"""
+        expected_base = StrategyConfig.STOP_LOSS_COOLDOWN_BASE_DAYS
+        for loss_pct in (0.0, 0.10):
+            with self.subTest(loss_pct=loss_pct):
+                self.assertEqual(calculate_cooldown_days(loss_pct), expected_base)
+
+    def test_calculate_cooldown_days_negative_loss_tiers_and_cap(self):
+        """Test cooldown tiers for -15%, -25% and max-cap behavior"""
+        cases = (
+            (-0.15, 10),
+            (-0.25, 15),
+            (-2.0, 60),  # capped from 105 to 60
+        )
+        with (
+            patch.object(StrategyConfig, "STOP_LOSS_COOLDOWN_BASE_DAYS", 5),
+            patch.object(StrategyConfig, "STOP_LOSS_COOLDOWN_EXTRA_DAYS_PER_10PCT", 5),
+            patch.object(StrategyConfig, "STOP_LOSS_COOLDOWN_MAX_DAYS", 60),
+        ):
+            for loss_pct, expected_days in cases:
+                with self.subTest(loss_pct=loss_pct):
+                    self.assertEqual(calculate_cooldown_days(loss_pct), expected_days)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,15 +5,19 @@ This module contains unit tests for the telegram_utils module.
 It tests Telegram message sending functionality and error handling.
 """
 
-import asyncio
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from telegram.error import NetworkError, TelegramError
+
 from telegram_utils import build_performance_summary_message, send_telegram_message
 
+_LONG_MESSAGE = "A" * 4096  # Telegram message limit is 4096 characters
+_SPECIAL_CHARACTER_MESSAGE = "한국 주식 시장 📈 AAPL +5.2% MSFT -2.1% 🚀"
 
-class TestTelegramUtils(unittest.TestCase):
-    """Test telegram_utils module functions"""
+
+class TestSendTelegramMessage(unittest.IsolatedAsyncioTestCase):
+    """Test send_telegram_message against a shared mocked telegram.Bot"""
 
     def setUp(self):
         """Set up test fixtures"""
@@ -21,146 +25,91 @@ class TestTelegramUtils(unittest.TestCase):
         self.chat_id = "test_chat_id_67890"
         self.test_message = "Test message from USA Stock Finder"
 
-    def test_send_telegram_message_success(self):
-        """Test successful Telegram message sending"""
-
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class:
-                # Mock the bot instance and its sendMessage method
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock()
-                mock_bot_class.return_value = mock_bot
-
-                # Call the function
-                await send_telegram_message(self.bot_token, self.chat_id, self.test_message)
+        # 모든 테스트가 같은 방식으로 Bot을 mock하므로 patch를 한 곳에서 시작하고 자동 정리
+        bot_patcher = patch("telegram_utils.telegram.Bot")
+        self.mock_bot_class = bot_patcher.start()
+        self.addCleanup(bot_patcher.stop)
+        self.mock_bot = MagicMock()
+        self.mock_bot.sendMessage = AsyncMock()
+        self.mock_bot_class.return_value = self.mock_bot
 
-                # Verify the bot was created with correct token
-                mock_bot_class.assert_called_once_with(self.bot_token)
+    async def test_send_telegram_message_success(self):
+        """Test successful Telegram message sending"""
+        await send_telegram_message(self.bot_token, self.chat_id, self.test_message)
 
-                # Verify sendMessage was called with correct parameters
-                mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=self.test_message)
+        # Verify the bot was created with correct token
+        self.mock_bot_class.assert_called_once_with(self.bot_token)
 
-        asyncio.run(run_test())
+        # Verify sendMessage was called with correct parameters
+        self.mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=self.test_message)
 
-    def test_send_telegram_message_network_error(self):
+    async def test_send_telegram_message_network_error(self):
         """Test Telegram message sending with network error"""
+        self.mock_bot.sendMessage.side_effect = NetworkError("Network error")
 
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class, patch("telegram_utils.print") as mock_print:
-                from telegram.error import NetworkError
-
-                # Mock the bot instance and its sendMessage method to raise NetworkError
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock(side_effect=NetworkError("Network error"))
-                mock_bot_class.return_value = mock_bot
-
-                # Call the function - should not raise exception
-                await send_telegram_message(self.bot_token, self.chat_id, self.test_message)
+        with patch("telegram_utils.print") as mock_print:
+            # Call the function - should not raise exception
+            await send_telegram_message(self.bot_token, self.chat_id, self.test_message)
 
-                # Verify error message was printed
-                mock_print.assert_called_once_with("Network error occurred while sending the message.")
+        # Verify error message was printed
+        mock_print.assert_called_once_with("Network error occurred while sending the message.")
 
-        asyncio.run(run_test())
-
-    def test_send_telegram_message_other_telegram_error(self):
+    async def test_send_telegram_message_other_telegram_error(self):
         """Test Telegram message sending with other Telegram errors"""
+        self.mock_bot.sendMessage.side_effect = TelegramError("Telegram error")
 
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class, patch("telegram_utils.print") as mock_print:
-                from telegram.error import TelegramError
-
-                # Mock the bot instance and its sendMessage method to raise TelegramError
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock(side_effect=TelegramError("Telegram error"))
-                mock_bot_class.return_value = mock_bot
-
-                # Call the function - should raise the exception
-                with self.assertRaises(TelegramError):
-                    await send_telegram_message(self.bot_token, self.chat_id, self.test_message)
-
-                # Verify error message was not printed (only NetworkError is caught)
-                mock_print.assert_not_called()
+        with patch("telegram_utils.print") as mock_print:
+            # Call the function - should raise the exception
+            with self.assertRaises(TelegramError):
+                await send_telegram_message(self.bot_token, self.chat_id, self.test_message)
 
-        asyncio.run(run_test())
+        # Verify error message was not printed (only NetworkError is caught)
+        mock_print.assert_not_called()
 
-    def test_send_telegram_message_empty_message(self):
+    async def test_send_telegram_message_empty_message(self):
         """Test Telegram message sending with empty message"""
+        empty_message = ""
+        await send_telegram_message(self.bot_token, self.chat_id, empty_message)
 
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class:
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock()
-                mock_bot_class.return_value = mock_bot
-
-                empty_message = ""
-                await send_telegram_message(self.bot_token, self.chat_id, empty_message)
-
-                mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=empty_message)
+        self.mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=empty_message)
 
-        asyncio.run(run_test())
-
-    def test_send_telegram_message_long_message(self):
+    async def test_send_telegram_message_long_message(self):
         """Test Telegram message sending with long message"""
+        await send_telegram_message(self.bot_token, self.chat_id, _LONG_MESSAGE)
 
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class:
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock()
-                mock_bot_class.return_value = mock_bot
-
-                long_message = "A" * 4096  # Telegram message limit is 4096 characters
-                await send_telegram_message(self.bot_token, self.chat_id, long_message)
-
-                mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=long_message)
+        self.mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=_LONG_MESSAGE)
 
-        asyncio.run(run_test())
-
-    def test_send_telegram_message_special_characters(self):
+    async def test_send_telegram_message_special_characters(self):
         """Test Telegram message sending with special characters"""
+        await send_telegram_message(self.bot_token, self.chat_id, _SPECIAL_CHARACTER_MESSAGE)
 
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class:
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock()
-                mock_bot_class.return_value = mock_bot
-
-                special_message = "한국 주식 시장 📈 AAPL +5.2% MSFT -2.1% 🚀"
-                await send_telegram_message(self.bot_token, self.chat_id, special_message)
-
-                mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=special_message)
-
-        asyncio.run(run_test())
+        self.mock_bot.sendMessage.assert_called_once_with(chat_id=self.chat_id, text=_SPECIAL_CHARACTER_MESSAGE)
 
-    def test_send_telegram_message_multiple_calls(self):
+    async def test_send_telegram_message_multiple_calls(self):
         """Test multiple Telegram message sending calls"""
+        messages = [
+            "First message: AAPL analysis",
+            "Second message: MSFT analysis",
+            "Third message: Portfolio update",
+        ]
 
-        async def run_test():
-            with patch("telegram_utils.telegram.Bot") as mock_bot_class:
-                mock_bot = MagicMock()
-                mock_bot.sendMessage = AsyncMock()
-                mock_bot_class.return_value = mock_bot
+        for message in messages:
+            await send_telegram_message(self.bot_token, self.chat_id, message)
 
-                messages = [
-                    "First message: AAPL analysis",
-                    "Second message: MSFT analysis",
-                    "Third message: Portfolio update",
-                ]
+        # Verify sendMessage was called for each message
+        self.assertEqual(self.mock_bot.sendMessage.call_count, 3)
 
-                for message in messages:
-                    await send_telegram_message(self.bot_token, self.chat_id, message)
+        # Verify all calls were made with correct parameters
+        # Use a simpler assertion that checks the calls were made
+        self.assertEqual(len(self.mock_bot.sendMessage.mock_calls), 3)
 
-                # Verify sendMessage was called for each message
-                self.assertEqual(mock_bot.sendMessage.call_count, 3)
+        # Check that each message was sent
+        for message in messages:
+            self.mock_bot.sendMessage.assert_any_call(chat_id=self.chat_id, text=message)
 
-                # Verify all calls were made with correct parameters
-                # Use a simpler assertion that checks the calls were made
-                self.assertEqual(len(mock_bot.sendMessage.mock_calls), 3)
 
-                # Check that each message was sent
-                for message in messages:
-                    mock_bot.sendMessage.assert_any_call(chat_id=self.chat_id, text=message)
-
-        asyncio.run(run_test())
+class TestTelegramUtils(unittest.TestCase):
+    """Test telegram_utils module functions"""
 
     def test_send_telegram_message_async_function(self):
         """Test that send_telegram_message is an async function"""
@@ -6,6 +6,7 @@ Unit tests for trailing_stop state persistence and highest-close update logic.
 
 import json
 import os
+import stat
 import tempfile
 import unittest
 from datetime import date
@@ -56,6 +57,47 @@ class TestTrailingStop(unittest.TestCase):
             loaded = json.load(f)
         self.assertEqual(loaded, state)
 
+    def test_save_trailing_state_keeps_previous_file_when_write_fails(self):
+        previous = {"AAPL": {"highest_close": 200.0, "last_update": "2026-03-27"}}
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(previous, f)
+
+        with patch("trailing_stop.TRAILING_STATE_PATH", self.state_path), patch(
+            "trailing_stop.json.dump", side_effect=OSError("disk full")
+        ):
+            with self.assertRaises(OSError):
+                save_trailing_state({"AAPL": {"highest_close": 210.5, "last_update": "2026-03-28"}})
+
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            self.assertEqual(json.load(f), previous)
+        self.assertEqual(os.listdir(self.temp_dir), ["trailing_state.json"])
+
+    def test_save_trailing_state_preserves_existing_file_mode(self):
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump({}, f)
+        os.chmod(self.state_path, 0o644)
+
+        with patch("trailing_stop.TRAILING_STATE_PATH", self.state_path):
+            save_trailing_state({"AAPL": {"highest_close": 210.5, "last_update": "2026-03-28"}})
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.state_path).st_mode), 0o644)
+
+    def test_save_trailing_state_new_file_uses_umask_default_mode(self):
+        previous_umask = os.umask(0o027)
+        self.addCleanup(os.umask, previous_umask)
+
+        with patch("trailing_stop.TRAILING_STATE_PATH", self.state_path):
+            save_trailing_state({"AAPL": {"highest_close": 210.5, "last_update": "2026-03-28"}})
+
+        self.assertEqual(stat.S_IMODE(os.stat(self.state_path).st_mode), 0o640)
+
+    def test_save_trailing_state_cleanup_failure_keeps_original_error(self):
+        with patch("trailing_stop.TRAILING_STATE_PATH", self.state_path), patch(
+            "trailing_stop.json.dump", side_effect=OSError("disk full")
+        ), patch("trailing_stop.os.remove", side_effect=FileNotFoundError("already gone")):
+            with self.assertRaisesRegex(OSError, "disk full"):
+                save_trailing_state({"AAPL": {"highest_close": 210.5, "last_update": "2026-03-28"}})
+
     def test_update_highest_close_initializes_new_symbol(self):
         state = {}
         today = date(2026, 3, 28)
@@ -82,6 +124,17 @@ class TestTrailingStop(unittest.TestCase):
         self.assertEqual(state["TSLA"]["highest_close"], 275.0)
         self.assertEqual(state["TSLA"]["last_update"], today.isoformat())
 
+    def test_update_highest_close_keeps_entry_when_unchanged_same_day(self):
+        today = date(2026, 3, 28)
+        entry = {"highest_close": 275.0, "last_update": today.isoformat(), "activated": True}
+        state = {"TSLA": entry}
+
+        result = update_highest_close(state, "TSLA", 260.0, today)
+
+        self.assertEqual(result, 275.0)
+        self.assertIs(state["TSLA"], entry)
+        self.assertEqual(entry, {"highest_close": 275.0, "last_update": today.isoformat(), "activated": True})
+
     def test_update_highest_close_ignores_non_positive_close_and_returns_previous_high(self):
         state = {
             "NVDA": {
@@ -0,0 +1,74 @@
+"""Smoke benchmark for ``file_utils.read_csv_first_column`` using cProfile."""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import csv
+import io
+import os
+import pstats
+import sys
+import tempfile
+from pathlib import Path
+
+# Allow direct script execution from repository root:
+# `python tools/profile_read_csv.py ...`
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from file_utils import read_csv_first_column  # pylint: disable=wrong-import-position
+
+
+def write_fixture_csv(path: str, rows: int) -> None:
+    """Write a synthetic portfolio CSV with ``rows`` ``STOCKnnnn-US`` symbols."""
+    with open(path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["Code", "Name", "Market", "Sector"])
+        for i in range(rows):
+            writer.writerow(
+                [f"STOCK{i:04d}-US", f"Test Stock {i}", "NYSE" if i % 2 == 0 else "Nasdaq", f"Sector {i % 10}"]
+            )
+
+
+def profile_read(csv_path: str, repeat: int = 1, top: int = 10) -> tuple[int, str]:
+    """Profile ``repeat`` reads of ``csv_path`` and return (symbol count, stats text)."""
+    profiler = cProfile.Profile()
+    symbols: list[str] = []
+    profiler.enable()
+    for _ in range(repeat):
+        symbols = read_csv_first_column(csv_path)
+    profiler.disable()
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top)
+    return len(symbols), stream.getvalue()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Profile read_csv_first_column on a synthetic CSV")
+    parser.add_argument("--rows", type=int, default=1000, help="Number of data rows in the fixture CSV")
+    parser.add_argument("--repeat", type=int, default=20, help="Number of reads to profile")
+    parser.add_argument("--top", type=int, default=10, help="Number of profile entries to print")
+    parser.add_argument("--csv", help="Profile an existing CSV instead of a generated fixture")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.csv:
+        count, stats = profile_read(args.csv, args.repeat, args.top)
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, "large_portfolio.csv")
+            write_fixture_csv(csv_path, args.rows)
+            count, stats = profile_read(csv_path, args.repeat, args.top)
+
+    print(f"symbols: {count}")
+    print(f"repeat: {args.repeat}")
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,12 @@ The trailing stop uses the highest close price reached since purchase
 and calculates a stop loss level based on ATR (Average True Range).
 """
 
+import contextlib
 import json
 import logging
 import os
+import stat
+import uuid
 from datetime import date
 from typing import Any, Dict
 
@@ -50,22 +53,48 @@ def load_trailing_state() -> Dict[str, Dict[str, Any]]:
         return {}
 
 
+def _existing_state_file_mode() -> int | None:
+    """기존 상태 파일의 권한 비트를 반환한다 (파일이 없으면 None)."""
+    try:
+        return stat.S_IMODE(os.stat(TRAILING_STATE_PATH).st_mode)
+    except FileNotFoundError:
+        return None
+
+
 def save_trailing_state(state: Dict[str, Dict[str, Any]]) -> None:
     """
     주어진 상태 딕셔너리를 trailing_state.json에 저장한다.
 
-    디렉토리가 없으면 생성한다.
+    디렉토리가 없으면 생성한다. 같은 디렉토리의 임시 파일에 먼저 기록한 뒤
+    os.replace로 교체하므로, 저장 도중 중단되어도 기존 파일이 손상되지 않는다.
+    임시 파일은 0o666으로 생성해 커널이 umask를 적용하게 하고, 기존 파일이 있으면
+    교체 전에 그 권한을 그대로 복사한다.
 
     Args:
         state (Dict[str, Dict[str, Any]]): Trailing state dictionary to save
     """
+    state_dir = os.path.dirname(TRAILING_STATE_PATH)
+    tmp_path = None
     try:
-        os.makedirs(os.path.dirname(TRAILING_STATE_PATH), exist_ok=True)
-        with open(TRAILING_STATE_PATH, "w", encoding="utf-8") as f:
+        os.makedirs(state_dir, exist_ok=True)
+        candidate_path = os.path.join(state_dir or ".", f".trailing_state.{uuid.uuid4().hex}.tmp")
+        fd = os.open(candidate_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        tmp_path = candidate_path
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
             json.dump(state, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        existing_mode = _existing_state_file_mode()
+        if existing_mode is not None:
+            os.chmod(tmp_path, existing_mode)
+        os.replace(tmp_path, TRAILING_STATE_PATH)
         logger.debug("Trailing state saved: %d symbols", len(state))
     except Exception as e:
         logger.error("Error saving trailing state file: %s", str(e))
+        if tmp_path is not None:
+            # 정리 실패가 원래 예외를 가리지 않도록 무시
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
         raise
 
 
@@ -80,6 +109,7 @@ def update_highest_close(
 
     - 기존 값이 없으면 현재 종가를 최고가로 설정.
     - 기존 값이 있으면 max(기존, 현재)로 갱신.
+    - 최고가와 갱신일이 이미 같으면 기존 항목을 그대로 둔다.
     - state를 직접 수정하고, 최신 highest_close를 반환한다.
 
     Args:
@@ -106,11 +136,14 @@ def update_highest_close(
 
     new_high = max(prev_high, close_price) if prev_high > 0 else close_price
 
-    state[symbol] = {
-        **entry,
-        "highest_close": new_high,
-        "last_update": today.isoformat(),
-    }
+    today_str = today.isoformat()
+    # 같은 날 최고가가 그대로면 기존 항목을 유지 (불필요한 dict 재생성 방지)
+    if entry.get("highest_close") != new_high or entry.get("last_update") != today_str:
+        state[symbol] = {
+            **entry,
+            "highest_close": new_high,
+            "last_update": today_str,
+        }
 
     if new_high > prev_high:
         logger.debug(